@@ -1,30 +1,70 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+import sys
 
+
+def _is_cli_entry(argv0: str) -> bool:
+    """True when the process was started as `tanuki` or `python -m tanuki_bot`."""
+    name = os.path.basename(argv0)
+    if name in ("tanuki", "tanuki.exe"):
+        return True
+    return name == "__main__.py" and os.path.basename(os.path.dirname(argv0)) == "tanuki_bot"
+
+
+# Fast path: `tanuki --version` should not pay for Typer/Rich/Click imports.
+if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version") and _is_cli_entry(sys.argv[0]):
+    from tanuki_bot.core.version import __version__
+
+    print(f"tanuki v{__version__}")
+    sys.exit(0)
+
+from typing import TYPE_CHECKING, ClassVar
+
+import functools
+import importlib
+import json
+import re
+
+import click
 import typer
+from typer.core import TyperGroup
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.text import Text
 
-from tanuki_bot.core.version import __version__
-from tanuki_bot.projects.commands import project_app
-from tanuki_bot.tasks.commands import task_app
-from tanuki_bot.ui.branding import show_banner
-from tanuki_bot.ui_web.server import serve
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from tanuki_bot.core.init import init_project
-from tanuki_bot.core.doctor import run_doctor
 
-from tanuki_bot.config.config import get_model, set_model, set_openai_key
-from tanuki_bot.core.plan import plan_from_brief
+class LazyGroup(TyperGroup):
+    """
+    Root group that imports sub-apps (project/task) only when they are invoked,
+    so `tanuki --version` or `tanuki doctor` don't pay for the whole tree.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, str]] = {
+        "project": "tanuki_bot.projects.commands:project_app",
+        "task": "tanuki_bot.tasks.commands:task_app",
+    }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_subcommands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = self.lazy_subcommands.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
 
-from tanuki_bot.core.runner import run_forever
+        module_name, attr = target.split(":")
+        sub_app = getattr(importlib.import_module(module_name), attr)
+        cmd = typer.main.get_command(sub_app)
+        cmd.name = cmd_name
+        return cmd
 
-app = typer.Typer(add_completion=False, no_args_is_help=False)
-app.add_typer(project_app, name="project")
-app.add_typer(task_app, name="task")
+
+app = typer.Typer(cls=LazyGroup, add_completion=False, no_args_is_help=False)
 
 console = Console()
 
@@ -32,11 +72,39 @@ ACCENT = "dark_orange"
 LINK = "dark_orange"
 ERR = "red"
 
+# Fixed command headings, styled once instead of re-parsing markup per call.
+_H_SETUP = Text("Tanuki setup\n", style=f"bold {ACCENT}")
+_H_PLAN = Text("Tanuki plan\n", style=f"bold {ACCENT}")
+_H_DOCTOR = Text("Tanuki doctor\n", style=f"bold {ACCENT}")
+_H_RUN = Text("Tanuki run\n", style=f"bold {ACCENT}")
+
+
+# One scan classifies the error; precedence is still decided by the if/elif order below.
+_ERROR_KEYWORDS_RE = re.compile(
+    r"(?P<quota>insufficient_quota|quota|billing|429)"
+    r"|(?P<auth>authentication|invalid|api key)"
+    r"|(?P<model>model)"
+    r"|(?P<model_bad>not found|400)",
+    re.IGNORECASE,
+)
+
+
+def _json_errors() -> bool:
+    """TANUKI_JSON=1: scripted callers get one-line JSON errors instead of Rich panels."""
+    return os.environ.get("TANUKI_JSON", "") not in ("", "0")
+
+
+def _exit_json_error(message: str) -> None:
+    print(json.dumps({"error": message}))
+    raise typer.Exit(code=1)
+
 
 def _print_nice_openai_error(message: str) -> None:
-    msg_lower = message.lower()
+    from rich.panel import Panel
+
+    hits = {m.lastgroup for m in _ERROR_KEYWORDS_RE.finditer(message)}
 
-    if "quota" in msg_lower or "billing" in msg_lower or "insufficient_quota" in msg_lower or "429" in msg_lower:
+    if "quota" in hits:
         title = "[bold red]OpenAI API quota / billing issue[/]"
         body = (
             "[bold]Tanuki can't call the OpenAI API because your API project has no available credits "
@@ -48,7 +116,7 @@ def _print_nice_openai_error(message: str) -> None:
             "• [green]tanuki plan[/]\n\n"
             "[dim]Note: ChatGPT Plus is separate from API billing. The API uses OpenAI Platform credits.[/]"
         )
-    elif "authentication" in msg_lower or "invalid" in msg_lower or "api key" in msg_lower:
+    elif "auth" in hits:
         title = "[bold red]OpenAI authentication failed[/]"
         body = (
             "[bold]Your API key looks invalid/revoked or not configured.[/]\n\n"
@@ -59,7 +127,7 @@ def _print_nice_openai_error(message: str) -> None:
             "• [green]tanuki doctor[/]\n"
             "• [green]tanuki plan[/]"
         )
-    elif "model" in msg_lower and ("invalid" in msg_lower or "not found" in msg_lower or "400" in msg_lower):
+    elif "model" in hits and "model_bad" in hits:
         title = "[bold red]Invalid model configured[/]"
         body = (
             "[bold]The configured model name is not accepted by the API.[/]\n\n"
@@ -91,57 +159,85 @@ def _print_nice_openai_error(message: str) -> None:
     )
 
 
+_HELP_SECTIONS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "Getting started",
+        (
+            ("tanuki project up --path <repo>", "Attach a repo folder and set it active"),
+            ("tanuki init", "Initialize Tanuki memory & backlog for the active project"),
+            ("tanuki setup", "Interactive setup (OpenAI API key + default model)"),
+            ("tanuki doctor", "Check Tanuki setup and detect missing steps"),
+            ("tanuki model [name]", "Show or set the model (e.g. gpt-5-mini)"),
+            ("tanuki plan", "Generate ARCHITECTURE.md + tasks.json from a brief"),
+        ),
+    ),
+    (
+        "Tasks",
+        (
+            ("tanuki task list", "View current tasks (filters: --status/--priority/--tag)"),
+            ("tanuki task show <id>", "Show full details for one task"),
+            ("tanuki task add", "Append new tasks from an incremental request"),
+        ),
+    ),
+    (
+        "Projects",
+        (
+            ("tanuki project list", "List registered projects"),
+            ("tanuki project show [id]", "Show project info (defaults to active)"),
+            ("tanuki project use <id>", "Switch the active project"),
+            ("tanuki project rename <id> --name <name>", "Rename a project (registry only)"),
+            ("tanuki project set-path <id> --path <folder>", "Update a project's repo path (registry only)"),
+            ("tanuki project remove <id>", "Remove a project from Tanuki registry (repo not deleted)"),
+        ),
+    ),
+    (
+        "UI / automation",
+        (
+            ("tanuki ui", "Open the local dashboard (projects + backlog)"),
+            ("tanuki run", "Run the autonomous loop (task -> changes -> checks -> PR -> status)"),
+        ),
+    ),
+)
+
+
+@functools.cache
+def _build_help_table() -> Table:
+    table = Table(title="Commands", show_header=True, header_style="bold bright_white")
+    table.add_column("Command", style=ACCENT, no_wrap=True)
+    table.add_column("What it does", style="white")
+
+    for title, rows in _HELP_SECTIONS:
+        table.add_row(f"[bold]{title}[/]", "", style="dim")
+        for cmd, desc in rows:
+            table.add_row(cmd, desc)
+
+    return table
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Show version and exit"),
 ) -> None:
     if version:
+        from tanuki_bot.core.version import __version__
+
         console.print(f"[bold {ACCENT}]tanuki[/] v{__version__}")
         raise typer.Exit()
 
     if ctx.invoked_subcommand is None:
+        from tanuki_bot.ui.branding import show_banner
+
         show_banner(console)
 
-        table = Table(title="Commands", show_header=True, header_style="bold bright_white")
-        table.add_column("Command", style=ACCENT, no_wrap=True)
-        table.add_column("What it does", style="white")
-
-        def section(title: str) -> None:
-            table.add_row(f"[bold]{title}[/]", "", style="dim")
-
-        section("Getting started")
-        table.add_row("tanuki project up --path <repo>", "Attach a repo folder and set it active")
-        table.add_row("tanuki init", "Initialize Tanuki memory & backlog for the active project")
-        table.add_row("tanuki setup", "Interactive setup (OpenAI API key + default model)")
-        table.add_row("tanuki doctor", "Check Tanuki setup and detect missing steps")
-        table.add_row("tanuki model [name]", "Show or set the model (e.g. gpt-5-mini)")
-        table.add_row("tanuki plan", "Generate ARCHITECTURE.md + tasks.json from a brief")
-
-        section("Tasks")
-        table.add_row("tanuki task list", "View current tasks (filters: --status/--priority/--tag)")
-        table.add_row("tanuki task show <id>", "Show full details for one task")
-        table.add_row("tanuki task add", "Append new tasks from an incremental request")
-
-        section("Projects")
-        table.add_row("tanuki project list", "List registered projects")
-        table.add_row("tanuki project show [id]", "Show project info (defaults to active)")
-        table.add_row("tanuki project use <id>", "Switch the active project")
-        table.add_row("tanuki project rename <id> --name <name>", "Rename a project (registry only)")
-        table.add_row("tanuki project set-path <id> --path <folder>", "Update a project's repo path (registry only)")
-        table.add_row("tanuki project remove <id>", "Remove a project from Tanuki registry (repo not deleted)")
-
-        section("UI / automation")
-        table.add_row("tanuki ui", "Open the local dashboard (projects + backlog)")
-        table.add_row("tanuki run", "Run the autonomous loop (task -> changes -> checks -> PR -> status)")
-
-        console.print(table)
+        console.print(_build_help_table())
         console.print('\n[dim]Tip:[/] register current folder with [bold]tanuki project up --path .[/]\n')
 
 
-@app.command()
 def init() -> None:
     """Initialize Tanuki workspace for the active project."""
+    from tanuki_bot.core.init import init_project
+
     try:
         path = init_project()
         console.print(f"[green]Tanuki initialized[/] at [dim]{path}[/]")
@@ -149,10 +245,11 @@ def init() -> None:
         console.print("[bold red]Error[/]: No active project. Run [bold]tanuki project up --path <repo>[/]")
 
 
-@app.command()
 def setup() -> None:
     """Interactive setup: API key + default model."""
-    console.print(f"[bold {ACCENT}]Tanuki setup[/]\n")
+    from tanuki_bot.config.config import get_model, set_model, set_openai_key
+
+    console.print(_H_SETUP)
 
     key = Prompt.ask("OpenAI API key", password=True)
     if key.strip():
@@ -168,17 +265,17 @@ def setup() -> None:
     console.print(f"[green]Model set[/] -> {get_model()}")
 
 
-@app.command()
 def config() -> None:
     """Backwards-compatible alias for setup (so users can run tanuki config)."""
     setup()
 
 
-@app.command()
 def model(
     name: str | None = typer.Argument(None, help="Optional model name to set, e.g. gpt-5-mini"),
 ) -> None:
     """Show or set the current model."""
+    from tanuki_bot.config.config import get_model, set_model
+
     if name:
         set_model(name)
         console.print(f"[green]Model set[/] -> {get_model()}")
@@ -186,23 +283,28 @@ def model(
         console.print(f"[bold {ACCENT}]Model[/] -> {get_model()}")
 
 
-@app.command()
 def plan(
     brief: str | None = typer.Option(None, "--brief", "-b", help="Project brief. If omitted, Tanuki will ask interactively."),
     file: str | None = typer.Option(None, "--file", "-f", help="Load brief from a text/markdown file."),
 ) -> None:
     """Generate ARCHITECTURE.md and tasks.json for the active project."""
+    from tanuki_bot.core.plan import plan_from_brief
+
     if file:
+        from pathlib import Path
+
         brief_text = Path(file).expanduser().read_text(encoding="utf-8")
     elif brief:
         brief_text = brief
     else:
-        console.print(f"[bold {ACCENT}]Tanuki plan[/]\n")
+        console.print(_H_PLAN)
         brief_text = Prompt.ask("Paste a short brief (one paragraph is enough)")
 
     try:
         arch_path, tasks_path = plan_from_brief(brief_text)
     except RuntimeError as e:
+        if _json_errors():
+            _exit_json_error(str(e))
         console.print()
         _print_nice_openai_error(str(e))
         console.print()
@@ -214,10 +316,11 @@ def plan(
     console.print(f"[dim]Tasks:[/] {tasks_path}")
 
 
-@app.command()
 def doctor() -> None:
     """Run diagnostics to check Tanuki setup."""
-    console.print(f"[bold {ACCENT}]Tanuki doctor[/]\n")
+    from tanuki_bot.core.doctor import run_doctor
+
+    console.print(_H_DOCTOR)
 
     results = run_doctor()
     has_error = False
@@ -236,7 +339,6 @@ def doctor() -> None:
         console.print("\n[green]All checks passed. Tanuki is ready.[/]")
 
 
-@app.command()
 def run(
     max_tasks: int | None = typer.Option(
         None,
@@ -256,7 +358,17 @@ def run(
     Autonomous loop: runs continuously until there are no TODO tasks left,
     or until it cannot continue because only BLOCKED tasks remain.
     """
-    console.print(f"[bold {ACCENT}]Tanuki run[/]\n")
+    from tanuki_bot.core.runner import run_forever
+
+    console.print(_H_RUN)
+
+    if not dry_run:
+        # Load openai + client while the runner does its git/tasks setup.
+        import threading
+
+        from tanuki_bot.core.llm import prewarm
+
+        threading.Thread(target=prewarm, daemon=True).start()
 
     try:
         results = run_forever(
@@ -266,6 +378,8 @@ def run(
             max_tasks=max_tasks,
         )
     except Exception as e:
+        if _json_errors():
+            _exit_json_error(str(e))
         console.print(f"[bold red]Error[/]: {e}")
         raise typer.Exit(code=1)
 
@@ -298,8 +412,48 @@ def run(
         else:
             console.print(f"[red]FAIL[/] {r.get('error','unknown error')}")
 
-@app.command()
 def ui(
     port: int = typer.Option(3847, "--port", "-p", help="Local UI port"),
 ) -> None:
-    serve(port=port)
\ No newline at end of file
+    from tanuki_bot.ui_web.server import serve
+
+    serve(port=port)
+
+
+_COMMANDS: dict[str, Callable[..., None]] = {
+    "init": init,
+    "setup": setup,
+    "config": config,
+    "model": model,
+    "plan": plan,
+    "doctor": doctor,
+    "run": run,
+    "ui": ui,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    # The root callback only takes flags, so the first positional token is the command.
+    for tok in argv:
+        if not tok.startswith("-"):
+            return tok
+    return None
+
+
+def _register_commands(argv: list[str]) -> None:
+    """
+    Register only the command being invoked (Typer introspects every signature it
+    is given). Falls back to registering everything for --help / unknown tokens,
+    and when the app is imported rather than run (tests, CliRunner, embedding).
+    """
+    wanted = _sniff_subcommand(argv)
+    if wanted in LazyGroup.lazy_subcommands:
+        return
+
+    for name, fn in _COMMANDS.items():
+        if wanted in _COMMANDS and name != wanted:
+            continue
+        app.command(name)(fn)
+
+
+_register_commands(sys.argv[1:] if _is_cli_entry(sys.argv[0]) else [])
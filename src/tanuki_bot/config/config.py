@@ -4,42 +4,44 @@ import json
 from pathlib import Path
 from typing import Any
 
+from tanuki_bot.utils.fs import write_json
+
 CONFIG_PATH = Path.home() / ".tanuki" / "config.json"
 
 DEFAULT_MODEL = "gpt-5-mini"
 
+# (mtime_ns, parsed config) of the last read; re-parsed only when the file changes.
+_CACHE: tuple[int, dict[str, Any]] | None = None
+
 
 def _load() -> dict[str, Any]:
-    if not CONFIG_PATH.exists():
+    global _CACHE
+    try:
+        st = CONFIG_PATH.stat()
+    except FileNotFoundError:
         return {}
-    return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    if _CACHE and _CACHE[0] == st.st_mtime_ns:
+        return _CACHE[1]
+    data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    _CACHE = (st.st_mtime_ns, data)
+    return data
 
 
 def _save(data: dict[str, Any]) -> None:
+    global _CACHE
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-
-def ensure_defaults() -> dict[str, Any]:
-    data = _load()
-    changed = False
-
-    if "openai" not in data:
-        data["openai"] = {}
-        changed = True
+    write_json(CONFIG_PATH, data)
+    _CACHE = None
 
-    if "model" not in data["openai"]:
-        data["openai"]["model"] = DEFAULT_MODEL
-        changed = True
 
-    if changed:
-        _save(data)
-
-    return data
+def _with_defaults(data: dict[str, Any]) -> dict[str, Any]:
+    # Pure: returns fresh top-level/openai dicts, never mutates (possibly cached) input.
+    openai = {"model": DEFAULT_MODEL, **(data.get("openai") or {})}
+    return {**data, "openai": openai}
 
 
 def set_openai_key(key: str) -> None:
-    data = ensure_defaults()
+    data = _with_defaults(_load())
     data["openai"]["api_key"] = key
     _save(data)
 
@@ -55,18 +57,18 @@ def get_openai_key() -> str | None:
 
 
 def get_model() -> str:
-    data = ensure_defaults()
+    data = _with_defaults(_load())
     return str(data["openai"].get("model") or DEFAULT_MODEL)
 
 
 def set_model(model: str) -> None:
-    data = ensure_defaults()
+    data = _with_defaults(_load())
     data["openai"]["model"] = model
     _save(data)
 
 
 def masked_config() -> dict[str, Any]:
-    data = ensure_defaults()
-    if "openai" in data and "api_key" in data["openai"]:
+    data = _with_defaults(_load())
+    if "api_key" in data["openai"]:
         data["openai"]["api_key"] = "********"
-    return data
\ No newline at end of file
+    return data
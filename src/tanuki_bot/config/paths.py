@@ -1,21 +1,38 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
-def tanuki_home() -> Path:
-    base = Path(os.environ.get("TANUKI_HOME", Path.home() / ".tanuki"))
+def _home_path(env: str | None) -> Path:
+    return Path(env or Path.home() / ".tanuki")
+
+@functools.lru_cache(maxsize=8)
+def _tanuki_home(env: str | None) -> Path:
+    # mkdir only once per TANUKI_HOME value; later calls are pure lookups.
+    base = _home_path(env)
     base.mkdir(parents=True, exist_ok=True)
     (base / "projects").mkdir(parents=True, exist_ok=True)
     return base
 
+def tanuki_home() -> Path:
+    return _tanuki_home(os.environ.get("TANUKI_HOME"))
+
+def tanuki_home_exists() -> bool:
+    """Check for the Tanuki home without creating it (unlike tanuki_home())."""
+    return _home_path(os.environ.get("TANUKI_HOME")).is_dir()
+
 def registry_path() -> Path:
     return tanuki_home() / "registry.json"
 
 def current_project_path() -> Path:
     return tanuki_home() / "current_project"
 
-def project_dir(project_id: str) -> Path:
-    p = tanuki_home() / "projects" / project_id
+@functools.lru_cache(maxsize=64)
+def _project_dir(home: Path, project_id: str) -> Path:
+    p = home / "projects" / project_id
     p.mkdir(parents=True, exist_ok=True)
-    return p
\ No newline at end of file
+    return p
+
+def project_dir(project_id: str) -> Path:
+    return _project_dir(tanuki_home(), project_id)
@@ -3,12 +3,19 @@ from __future__ import annotations
 from pathlib import Path
 
 from tanuki_bot.config.config import get_model, has_openai_key
-from tanuki_bot.projects.registry import Registry
+from tanuki_bot.config.paths import tanuki_home_exists
 
 
 def run_doctor() -> list[tuple[bool, str]]:
     checks: list[tuple[bool, str]] = []
 
+    # Never set up: report it without creating ~/.tanuki or loading the registry.
+    if not tanuki_home_exists():
+        checks.append((False, "Tanuki home not initialized (run: tanuki project up --path .)"))
+        return checks
+
+    from tanuki_bot.projects.registry import Registry
+
     reg = Registry()
     pid = reg.get_active_id()
 
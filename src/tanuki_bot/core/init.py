@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 
 from tanuki_bot.projects.registry import Registry
+from tanuki_bot.utils.fs import write_json
 
 
 def init_project() -> Path:
@@ -22,33 +23,35 @@ def init_project() -> Path:
     tasks.mkdir(parents=True, exist_ok=True)
     runs.mkdir(parents=True, exist_ok=True)
 
+    # One directory listing each instead of a stat per file
+    existing = {e.name for e in os.scandir(base)}
+    existing_mem = {e.name for e in os.scandir(memory)}
+    existing_tasks = {e.name for e in os.scandir(tasks)}
+
     # project.json
     pj = base / "project.json"
-    if not pj.exists():
+    if "project.json" not in existing:
         proj = reg.get(pid)
-        pj.write_text(
-            json.dumps(
-                {
-                    "id": proj.id,
-                    "name": proj.name,
-                    "repo_path": proj.repo_path,
-                    "created_at": proj.created_at,
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
+        write_json(
+            pj,
+            {
+                "id": proj.id,
+                "name": proj.name,
+                "repo_path": proj.repo_path,
+                "created_at": proj.created_at,
+            },
         )
 
     # memory files
     arch = memory / "ARCHITECTURE.md"
-    if not arch.exists():
+    if "ARCHITECTURE.md" not in existing_mem:
         arch.write_text(
             "# Architecture\n\nInitial architecture not defined yet.\n",
             encoding="utf-8",
         )
 
     ctx = memory / "CONTEXT.md"
-    if not ctx.exists():
+    if "CONTEXT.md" not in existing_mem:
         ctx.write_text(
             "# Project Context\n\nDescribe goals, constraints and scope here.\n",
             encoding="utf-8",
@@ -56,10 +59,7 @@ def init_project() -> Path:
 
     # tasks.json
     tj = tasks / "tasks.json"
-    if not tj.exists():
-        tj.write_text(
-            json.dumps({"tasks": []}, indent=2),
-            encoding="utf-8",
-        )
+    if "tasks.json" not in existing_tasks:
+        write_json(tj, {"tasks": []})
 
     return base
\ No newline at end of file
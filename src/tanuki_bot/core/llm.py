@@ -1,31 +1,73 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
-
-from openai import OpenAI
-from openai import RateLimitError, AuthenticationError, APIConnectionError, BadRequestError
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable
 
 from tanuki_bot.config.config import get_model, get_openai_key
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+# The openai SDK (httpx, pydantic, anyio...) is imported on first call, not on import.
+_OPENAI: ModuleType | None = None
+
+# (api_key, client): reused across calls so the HTTP connection pool survives.
+_CLIENT: tuple[str, OpenAI] | None = None
+
+
+def _openai() -> ModuleType:
+    global _OPENAI
+    if _OPENAI is None:
+        import openai
+
+        _OPENAI = openai
+    return _OPENAI
+
 
 def get_client() -> OpenAI:
+    global _CLIENT
     key = get_openai_key()
     if not key:
         raise RuntimeError("Missing OpenAI API key. Run: tanuki setup")
-    return OpenAI(api_key=key)
+    if _CLIENT and _CLIENT[0] == key:
+        return _CLIENT[1]
+    client = _openai().OpenAI(api_key=key)
+    _CLIENT = (key, client)
+    return client
+
+
+def prewarm() -> None:
+    """
+    Import the SDK and build the client ahead of the first request (best effort).
+    Failures are left for that request to raise: missing key (RuntimeError), SDK
+    not installed (ImportError), unreadable config (OSError/ValueError).
+    """
+    try:
+        get_client()
+    except (RuntimeError, ImportError, OSError, ValueError):
+        return
+    except _openai().OpenAIError:
+        return
 
 
 def _extract_text(output: Iterable[Any]) -> str:
-    chunks: list[str] = []
-    for item in output:
-        if getattr(item, "type", None) == "message":
-            for c in getattr(item, "content", []):
-                if getattr(c, "type", None) == "output_text":
-                    chunks.append(c.text)
-    return "\n".join(chunks).strip()
+    return "\n".join(
+        c.text
+        for item in output
+        if getattr(item, "type", None) == "message"
+        for c in getattr(item, "content", ())
+        if getattr(c, "type", None) == "output_text"
+    ).strip()
 
 
-def text(prompt: str, system: str | None = None) -> str:
+def text(prompt: str, system: str | None = None, cache_key: str | None = None) -> str:
+    """
+    Single-turn call. Put stable content at the START of `system`/`prompt`: OpenAI
+    caches repeated prompt prefixes automatically, and `cache_key` (sent as
+    prompt_cache_key) keeps related requests routed to the same cache.
+    """
+    openai = _openai()
     client = get_client()
     model = get_model()
 
@@ -38,25 +80,26 @@ def text(prompt: str, system: str | None = None) -> str:
         resp = client.responses.create(
             model=model,
             input=messages,
+            extra_body={"prompt_cache_key": cache_key} if cache_key else None,
         )
-    except RateLimitError as e:
+    except openai.RateLimitError as e:
         # This includes insufficient_quota
         raise RuntimeError(
             "OpenAI API quota/billing issue (429). "
             "Go to OpenAI Platform → Billing/Usage and add credits or enable billing. "
             "Then retry `tanuki plan`."
         ) from e
-    except AuthenticationError as e:
+    except openai.AuthenticationError as e:
         raise RuntimeError(
             "OpenAI authentication failed. Your API key is invalid or revoked. "
             "Run `tanuki setup` and paste a valid key."
         ) from e
-    except BadRequestError as e:
+    except openai.BadRequestError as e:
         raise RuntimeError(
             "OpenAI request rejected (400). This can happen if the model name is invalid. "
             "Check `tanuki model` and try a valid model (e.g. gpt-5-mini)."
         ) from e
-    except APIConnectionError as e:
+    except openai.APIConnectionError as e:
         raise RuntimeError(
             "OpenAI connection failed. Check your network and try again."
         ) from e
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import json
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,16 +10,33 @@ from typing import Any, Iterable
 
 from tanuki_bot.core.init import init_project
 from tanuki_bot.core.llm import text
-from tanuki_bot.core.repo_scan import snapshot_repo
+from tanuki_bot.core.repo_scan import format_tree, snapshot_repo
 from tanuki_bot.projects.registry import Registry
+from tanuki_bot.utils.fs import json_dumps_bytes, json_loads, read_json, write_json
 
 
 # -------------------------
 # Helpers
 # -------------------------
 
+_DIGITS_RE = re.compile(r"(\d+)")
+
+_CTX_RE = re.compile(r"===CONTEXT===\s*(.*?)\s*===ARCHITECTURE===", re.DOTALL)
+_ARCH_RE = re.compile(r"===ARCHITECTURE===\s*(.*?)\s*===TASKS_JSON===", re.DOTALL)
+_TASKS_MARKER = "===TASKS_JSON==="
+
+# Project ids whose workspace was already ensured in this process
+_INITED: set[str] = set()
+
+
+def _text_after(s: str, marker: str) -> str:
+    """Everything after the first `marker`, stripped ("" if absent). Literal find, no regex."""
+    i = s.find(marker)
+    return s[i + len(marker) :].strip() if i >= 0 else ""
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _workspace_paths(project_id: str) -> dict[str, Path]:
@@ -31,10 +49,18 @@ def _workspace_paths(project_id: str) -> dict[str, Path]:
     }
 
 
-def _read_text(path: Path) -> str:
-    if not path.exists():
+def _read_text(path: Path, errors: str = "ignore") -> str:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return ""
-    return path.read_text(encoding="utf-8", errors="ignore")
+    return _read_text_cached(str(path), st.st_mtime_ns, st.st_size, errors)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_text_cached(path: str, mtime_ns: int, size: int, errors: str) -> str:
+    # Keyed on (mtime, size): unchanged CONTEXT/ARCHITECTURE docs are decoded once per process
+    return Path(path).read_text(encoding="utf-8", errors=errors)
 
 
 def _write_text(path: Path, content: str) -> None:
@@ -43,64 +69,56 @@ def _write_text(path: Path, content: str) -> None:
 
 
 def _load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
-        return default
-    return json.loads(path.read_text(encoding="utf-8"))
+    return read_json(path, default)
 
 
 def _save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(path, data)
 
 
 def _norm(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    # split() strips and collapses whitespace runs in C; no regex needed
+    return " ".join(s.lower().split())
 
 
 def _safe_list(v: Any) -> list[str]:
     if isinstance(v, list):
+        # Common case (tags already strings): reuse the parsed list, no copy
+        if all(type(x) is str for x in v):
+            return v
         return [str(x) for x in v]
     return []
 
 
+# Accept: P1/P2/P3 or p0/p1/p2/p3 (any case). Normalize to P1/P2/P3 (simple).
+_PRIORITY_MAP = {"p0": "P1", "p1": "P1", "p2": "P2", "p3": "P3"}
+
+# Keep it simple & automatable
+_STATUS_MAP = {
+    "todo": "todo",
+    "doing": "doing",
+    "blocked": "blocked",
+    "done": "done",
+    "skipped": "skipped",
+    "in progress": "doing",
+    "in-progress": "doing",
+    "complete": "done",
+    "completed": "done",
+    "pending": "todo",
+}
+
+
 def _clamp_priority(p: str) -> str:
-    # Accept: P1/P2/P3 or p0/p1/p2/p3. Normalize to P1/P2/P3 (simple).
-    s = _norm(p)
-    if s in {"p0", "p1"}:
-        return "P1"
-    if s in {"p2"}:
-        return "P2"
-    if s in {"p3"}:
-        return "P3"
-    if s in {"p1", "p2", "p3"}:
-        return s.upper()
-    if s in {"p0", "p1", "p2", "p3"}:
-        return s.upper()
-    if s in {"p1", "p2", "p3"}:
-        return s.upper()
-    if s in {"p1", "p2", "p3"}:
-        return s.upper()
-    # If the model returns something else, default:
-    return "P2"
+    # If the model returns something else, default to P2
+    return _PRIORITY_MAP.get(_norm(p), "P2")
 
 
 def _clamp_status(s: str) -> str:
-    # Keep it simple & automatable
-    s = _norm(s)
-    if s in {"todo", "doing", "blocked", "done", "skipped"}:
-        return s
-    if s in {"in progress", "in-progress"}:
-        return "doing"
-    if s in {"complete", "completed"}:
-        return "done"
-    if s in {"pending"}:
-        return "todo"
-    return "todo"
-
-
-@dataclass
+    return _STATUS_MAP.get(_norm(s), "todo")
+
+
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
@@ -131,16 +149,17 @@ class Task:
         }
 
 
-def _task_from_any(d: dict[str, Any]) -> Task:
+def _task_id(raw_id: Any) -> int:
     # id can come as int or str; normalize to int
-    raw_id = d.get("id")
     if isinstance(raw_id, int):
-        tid = raw_id
-    else:
-        # Try parse strings like "t1" or "001" => numeric fallback
-        m = re.search(r"(\d+)", str(raw_id or "0"))
-        tid = int(m.group(1)) if m else 0
+        return raw_id
+    # Try parse strings like "t1" or "001" => numeric fallback
+    m = _DIGITS_RE.search(str(raw_id or "0"))
+    return int(m.group(1)) if m else 0
+
 
+def _task_from_any(d: dict[str, Any]) -> Task:
+    tid = _task_id(d.get("id"))
     title = str(d.get("title", "")).strip()
     description = str(d.get("description", "")).strip()
     status = _clamp_status(str(d.get("status", "todo")))
@@ -200,6 +219,17 @@ def _load_tasks_payload(path: Path) -> dict[str, Any]:
     }
 
 
+def _find_task(path: Path, task_id: int) -> Task | None:
+    """Look up one task, building a Task only for the entry that matches."""
+    tasks_raw = _load_json(path, {"tasks": []}).get("tasks", [])
+    if not isinstance(tasks_raw, list):
+        return None
+    for x in tasks_raw:
+        if isinstance(x, dict) and _task_id(x.get("id")) == task_id:
+            return _task_from_any(x)
+    return None
+
+
 def _save_tasks_payload(path: Path, version: int, next_id: int, tasks: list[Task]) -> None:
     _save_json(
         path,
@@ -211,6 +241,20 @@ def _save_tasks_payload(path: Path, version: int, next_id: int, tasks: list[Task
     )
 
 
+def _write_outputs(
+    p: dict[str, Path], ctx_md: str, arch_md: str, *, version: int, next_id: int, tasks: list[Task]
+) -> None:
+    """Write CONTEXT.md, ARCHITECTURE.md and tasks.json concurrently (independent files)."""
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futs = [
+            ex.submit(_write_text, p["context"], ctx_md),
+            ex.submit(_write_text, p["architecture"], arch_md),
+            ex.submit(_save_tasks_payload, p["tasks"], version, next_id, tasks),
+        ]
+        for f in futs:
+            f.result()
+
+
 def _find_match(existing: Iterable[Task], cand_title: str) -> Task | None:
     """
     Cheap matching: title normalization exact match.
@@ -223,6 +267,14 @@ def _find_match(existing: Iterable[Task], cand_title: str) -> Task | None:
     return None
 
 
+def _title_index(existing: Iterable[Task]) -> dict[str, Task]:
+    """Normalized title -> first task with that title (same winner as _find_match)."""
+    index: dict[str, Task] = {}
+    for t in existing:
+        index.setdefault(_norm(t.title), t)
+    return index
+
+
 # -------------------------
 # LLM output parsing
 # -------------------------
@@ -240,21 +292,86 @@ def _extract_blocks(s: str) -> tuple[str, str, str]:
     Backwards compatible:
     - if CONTEXT missing, return "" for context.
     """
-    ctx_pat = r"===CONTEXT===\s*(.*?)\s*===ARCHITECTURE==="
-    arch_pat = r"===ARCHITECTURE===\s*(.*?)\s*===TASKS_JSON==="
-    tasks_pat = r"===TASKS_JSON===\s*(.*)\s*$"
-
-    mctx = re.search(ctx_pat, s, flags=re.DOTALL)
-    march = re.search(arch_pat, s, flags=re.DOTALL)
-    mtasks = re.search(tasks_pat, s, flags=re.DOTALL)
+    mctx = _CTX_RE.search(s)
+    march = _ARCH_RE.search(s)
 
     ctx = (mctx.group(1).strip() if mctx else "").strip()
     arch = (march.group(1).strip() if march else "").strip()
-    tasks = (mtasks.group(1).strip() if mtasks else "").strip()
+    tasks = _text_after(s, _TASKS_MARKER)
 
     return ctx, arch, tasks
 
 
+def _parse_tasks_json(raw: str) -> list[dict[str, Any]]:
+    """
+    Decode the model's {"tasks": [...]} block in one pass, keeping only dict
+    entries. Field coercion stays lenient (_task_from_any / merge helpers), so
+    malformed or missing JSON just yields [].
+    """
+    try:
+        parsed = json_loads(raw)
+    except ValueError:
+        return []
+    tlist = parsed.get("tasks") if isinstance(parsed, dict) else None
+    if not isinstance(tlist, list):
+        return []
+    return [x for x in tlist if isinstance(x, dict)]
+
+
+# -------------------------
+# Prompt (static parts)
+# -------------------------
+
+_PLAN_SYSTEM = (
+    "You are Tanuki, an expert staff-level software engineer and architect. "
+    "You generate pragmatic project planning artifacts. "
+    "Be concise, actionable, and avoid fluff. "
+    "Never output code unless asked (we are planning now)."
+)
+
+_PLAN_FORMAT = """Using the project data below, return EXACTLY three blocks:
+
+===CONTEXT===
+Markdown for CONTEXT.md with sections:
+- Goals (what we are building)
+- Scope / non-goals
+- Constraints & assumptions
+- Decisions log (short bullets)
+- Open questions
+
+Rules for CONTEXT.md:
+- Keep it user/product oriented, not folder listing.
+- Capture the user brief and key decisions.
+- Do NOT duplicate architecture.
+
+===ARCHITECTURE===
+Markdown for ARCHITECTURE.md with sections:
+- Overview (architecture overview, not product brief)
+- Modules / folder responsibilities (describe where things live)
+- Data model (high level, if needed)
+- CLI commands (current + planned)
+- Quality gates (lint/tests/build)
+
+Rules for ARCHITECTURE.md:
+- Focus on repo structure and responsibilities.
+- Do NOT repeat user brief / goals (that belongs in CONTEXT.md).
+- Do NOT write code.
+
+===TASKS_JSON===
+A JSON object: { "tasks": [ ... ] }
+
+Rules for TASKS_JSON:
+- Do NOT write code.
+- Tasks must be actionable and ordered logically.
+- 10-30 tasks.
+- IMPORTANT: Preserve existing tasks by referencing their existing "id" when appropriate.
+- If a task already exists but needs improvement, keep its same "id" and update title/description/priority/tags.
+- NEVER reset statuses: keep status fields as-is unless a task truly must change.
+- New tasks: you may omit "id" or set it to null; Tanuki will assign IDs.
+- Each task must have: title, description, status (todo/doing/blocked/done/skipped), priority (P1/P2/P3), tags (list).
+"""
+
+
 # -------------------------
 # Main entry
 # -------------------------
@@ -265,15 +382,17 @@ def plan_from_brief(brief: str) -> tuple[Path, Path]:
     if not pid:
         raise RuntimeError("No active project")
 
-    # Ensure initialized workspace exists
-    init_project()
+    # Ensure initialized workspace exists (once per process; it never goes away mid-run)
+    if pid not in _INITED:
+        init_project()
+        _INITED.add(pid)
     p = _workspace_paths(pid)
 
     proj = reg.get(pid)
     if not proj:
         raise RuntimeError("Active project not found in registry")
 
-    snap = snapshot_repo(proj.repo_path)
+    snap = snapshot_repo(proj.repo_path, max_tree=600)
 
     existing_arch = _read_text(p["architecture"])
     existing_ctx = _read_text(p["context"])
@@ -298,81 +417,36 @@ def plan_from_brief(brief: str) -> tuple[Path, Path]:
     important_block = "\n\n".join(
         f"--- {k} ---\n{v}" for k, v in snap.important_files.items() if v.strip()
     )
-    tree_block = "\n".join(snap.tree[:600])
-
-    system = (
-        "You are Tanuki, an expert staff-level software engineer and architect. "
-        "You generate pragmatic project planning artifacts. "
-        "Be concise, actionable, and avoid fluff. "
-        "Never output code unless asked (we are planning now)."
-    )
+    tree_block = format_tree(snap.tree)
 
+    # Most stable content first so the provider's prefix cache can reuse it across
+    # runs: fixed instructions -> repo snapshot -> current docs/tasks -> brief (last).
     prompt = f"""
+{_PLAN_FORMAT}
 Project name: {proj.name}
 Repo path: {proj.repo_path}
 
-User brief (latest):
-{brief}
-
-Existing CONTEXT.md (current state):
-{existing_ctx}
-
-Existing ARCHITECTURE.md (current state):
-{existing_arch}
-
-Existing tasks (compact, keep IDs stable):
-{json.dumps({"tasks": existing_tasks_compact}, ensure_ascii=False, indent=2)}
-
 Repo tree (truncated):
 {tree_block}
 
 Important files (truncated):
 {important_block}
 
-Return EXACTLY three blocks:
-
-===CONTEXT===
-Markdown for CONTEXT.md with sections:
-- Goals (what we are building)
-- Scope / non-goals
-- Constraints & assumptions
-- Decisions log (short bullets)
-- Open questions
-
-Rules for CONTEXT.md:
-- Keep it user/product oriented, not folder listing.
-- Capture the user brief and key decisions.
-- Do NOT duplicate architecture.
-
-===ARCHITECTURE===
-Markdown for ARCHITECTURE.md with sections:
-- Overview (architecture overview, not product brief)
-- Modules / folder responsibilities (describe where things live)
-- Data model (high level, if needed)
-- CLI commands (current + planned)
-- Quality gates (lint/tests/build)
+Existing CONTEXT.md (current state):
+{existing_ctx}
 
-Rules for ARCHITECTURE.md:
-- Focus on repo structure and responsibilities.
-- Do NOT repeat user brief / goals (that belongs in CONTEXT.md).
-- Do NOT write code.
+Existing ARCHITECTURE.md (current state):
+{existing_arch}
 
-===TASKS_JSON===
-A JSON object: {{ "tasks": [ ... ] }}
+Existing tasks (compact, keep IDs stable):
+{json_dumps_bytes({"tasks": existing_tasks_compact}).decode("utf-8")}
 
-Rules for TASKS_JSON:
-- Do NOT write code.
-- Tasks must be actionable and ordered logically.
-- 10-30 tasks.
-- IMPORTANT: Preserve existing tasks by referencing their existing "id" when appropriate.
-- If a task already exists but needs improvement, keep its same "id" and update title/description/priority/tags.
-- NEVER reset statuses: keep status fields as-is unless a task truly must change.
-- New tasks: you may omit "id" or set it to null; Tanuki will assign IDs.
-- Each task must have: title, description, status (todo/doing/blocked/done/skipped), priority (P1/P2/P3), tags (list).
+User brief (latest):
+{brief}
 """
 
     try:
-        combined = text(prompt, system=system)
+        combined = text(prompt, system=_PLAN_SYSTEM, cache_key=f"tanuki-plan:{pid}")
     except Exception as e:
         # Friendly error (billing/quota/network etc). Keep it simple:
         raise RuntimeError(
@@ -403,18 +477,13 @@ Rules for TASKS_JSON:
         arch_md = existing_arch or "# Architecture\n\n(Architecture not defined yet.)\n"
 
     # Parse tasks JSON
-    generated_tasks: list[dict[str, Any]] = []
-    try:
-        parsed = json.loads(tasks_json)
-        tlist = parsed.get("tasks", [])
-        if isinstance(tlist, list):
-            generated_tasks = [x for x in tlist if isinstance(x, dict)]
-    except Exception:
-        generated_tasks = []
+    generated_tasks = _parse_tasks_json(tasks_json)
+
+    # One timestamp for everything this plan run touches
+    now = _now_iso()
 
     # If parsing failed, keep existing and add a single blocking task (numeric id)
     if not generated_tasks:
-        now = _now_iso()
         # Only add if not already present
         if not _find_match(existing_tasks, "Fix plan output"):
             new_task = Task(
@@ -437,9 +506,7 @@ Rules for TASKS_JSON:
             next_id += 1
 
         # Write outputs (still update context/architecture)
-        _write_text(p["context"], ctx_md)
-        _write_text(p["architecture"], arch_md)
-        _save_tasks_payload(p["tasks"], version=version, next_id=next_id, tasks=existing_tasks)
+        _write_outputs(p, ctx_md, arch_md, version=version, next_id=next_id, tasks=existing_tasks)
         return p["architecture"], p["tasks"]
 
     # Merge strategy:
@@ -447,10 +514,9 @@ Rules for TASKS_JSON:
     # - If id missing/null => try title match => else new id
     # - Preserve status & timestamps of existing tasks unless explicitly changed
     by_id: dict[int, Task] = {t.id: t for t in existing_tasks if t.id > 0}
+    by_title = _title_index(existing_tasks)
     merged: list[Task] = []
 
-    now = _now_iso()
-
     def _apply_update(old: Task, upd: dict[str, Any]) -> Task:
         title = str(upd.get("title", old.title)).strip() or old.title
         description = str(upd.get("description", old.description)).strip() or old.description
@@ -513,7 +579,7 @@ Rules for TASKS_JSON:
             tid = None
         else:
             # e.g. "t12"
-            m = re.search(r"(\d+)", str(cand_id))
+            m = _DIGITS_RE.search(str(cand_id))
             tid = int(m.group(1)) if m else None
 
         title = str(cand.get("title", "")).strip()
@@ -527,7 +593,7 @@ Rules for TASKS_JSON:
             continue
 
         # Try title match (avoid duplicates)
-        matched = _find_match(existing_tasks, title) if title else None
+        matched = by_title.get(_norm(title)) if title else None
         if matched and matched.id in by_id:
             updated = _apply_update(matched, cand)
             merged.append(updated)
@@ -567,8 +633,6 @@ Rules for TASKS_JSON:
     # Sort: keep model ordering first, then leftover existing. That’s already the case.
 
     # Write files
-    _write_text(p["context"], ctx_md)
-    _write_text(p["architecture"], arch_md)
-    _save_tasks_payload(p["tasks"], version=version, next_id=next_id, tasks=merged)
+    _write_outputs(p, ctx_md, arch_md, version=version, next_id=next_id, tasks=merged)
 
     return p["architecture"], p["tasks"]
\ No newline at end of file
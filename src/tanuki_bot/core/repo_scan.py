@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import functools
+import itertools
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -45,14 +50,62 @@ IMPORTANT_CANDIDATES = [
 ]
 
 
-def _is_ignored(path: Path) -> bool:
-    parts = set(path.parts)
-    return any(p in DEFAULT_IGNORE_DIRS for p in parts)
+def _walk_files(root: Path) -> Iterator[str]:
+    """
+    Yield repo-relative file paths (posix style), depth-first in name order.
+    Ignored directories are pruned before descending, so node_modules/.git/...
+    cost one dirent each instead of a full walk.
+    """
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs: list[tuple[str, str]] = []
+        for e in entries:
+            if e.name in DEFAULT_IGNORE_DIRS:
+                continue
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append((e.path, f"{rel}{e.name}/"))
+            elif e.is_file():
+                yield rel + e.name
+        stack.extend(reversed(subdirs))
+
+
+def format_tree(tree: list[str]) -> str:
+    """
+    Render snapshot paths for a prompt, writing each directory prefix once:
+
+        README.md
+        src/app/
+          main.py
+          util.py
+
+    Relies on _walk_files() order (a directory's files are contiguous).
+    """
+    lines: list[str] = []
+    current: str | None = None
+    for rel in tree:
+        d, _, name = rel.rpartition("/")
+        if not d:
+            lines.append(name)
+            continue
+        if d != current:
+            lines.append(f"{d}/")
+            current = d
+        lines.append(f"  {name}")
+    return "\n".join(lines)
 
 
 def _safe_read(path: Path, limit_chars: int = 12_000) -> str:
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        # Text-mode read(n) counts characters: a huge README costs ~limit of I/O, not its size
+        with path.open(encoding="utf-8", errors="ignore") as f:
+            text = f.read(limit_chars + 1)
         if len(text) > limit_chars:
             return text[:limit_chars] + "\n\n...<truncated>..."
         return text
@@ -60,32 +113,80 @@ def _safe_read(path: Path, limit_chars: int = 12_000) -> str:
         return ""
 
 
+SRC_ENTRYPOINTS = ["src/main.ts", "src/index.ts", "src/app.ts", "src/main.py", "src/__main__.py"]
+
+
+def _scan_candidates(root: Path) -> tuple[int, dict[str, os.DirEntry[str]]]:
+    """
+    One scandir of root (and of src/, if present) instead of a stat per candidate.
+    Returns (root entry count, {relative name: entry}) for candidates that are files,
+    in IMPORTANT_CANDIDATES then SRC_ENTRYPOINTS order.
+    """
+    with os.scandir(root) as it:
+        top = {e.name: e for e in it}
+
+    found: dict[str, os.DirEntry[str]] = {}
+    for name in IMPORTANT_CANDIDATES:
+        e = top.get(name)
+        if e is not None and e.is_file():
+            found[name] = e
+
+    src = top.get("src")
+    if src is not None and src.is_dir():
+        with os.scandir(src.path) as it:
+            src_files = {e.name: e for e in it}
+        for extra in SRC_ENTRYPOINTS:
+            e = src_files.get(extra.removeprefix("src/"))
+            if e is not None and e.is_file():
+                found[extra] = e
+
+    return len(top), found
+
+
 def snapshot_repo(repo_path: str, max_tree: int = 800) -> RepoSnapshot:
     root = Path(repo_path).expanduser().resolve()
+    try:
+        found, fingerprint = _fingerprint(root)
+    except OSError:
+        # Missing/moved repo (or not a directory): empty snapshot, nothing to cache
+        return RepoSnapshot(repo_path=str(root), tree=[], important_files={})
+    return _snapshot_cached(root, max_tree, tuple(found), fingerprint)
+
+
+def _fingerprint(root: Path) -> tuple[dict[str, os.DirEntry[str]], tuple[object, ...]]:
+    count, found = _scan_candidates(root)
+
+    # Cheap change detector: root mtime + entry count, plus (mtime, size) of the
+    # files whose contents end up in the snapshot, plus .git/index (rewritten by
+    # add/commit/checkout: git-level changes without spawning `git rev-parse`).
+    # Unstaged in-place edits deeper in the tree don't change it, so it is only
+    # used for in-process reuse.
+    files = []
+    for name, e in found.items():
+        st = e.stat()
+        files.append((name, st.st_mtime_ns, st.st_size))
+    try:
+        git_index = (root / ".git" / "index").stat().st_mtime_ns
+    except OSError:
+        git_index = 0
+    fingerprint = (root.stat().st_mtime_ns, count, git_index, tuple(files))
+    return found, fingerprint
+
 
-    tree: list[str] = []
+@functools.lru_cache(maxsize=8)
+def _snapshot_cached(
+    root: Path, max_tree: int, candidates: tuple[str, ...], fingerprint: tuple[object, ...]
+) -> RepoSnapshot:
     important: dict[str, str] = {}
 
-    # Build tree (files only)
-    for p in root.rglob("*"):
-        if _is_ignored(p):
-            continue
-        if p.is_file():
-            rel = str(p.relative_to(root))
-            tree.append(rel)
-            if len(tree) >= max_tree:
-                break
+    # Build tree (files only); the walk stops as soon as max_tree paths are taken
+    tree = list(itertools.islice(_walk_files(root), max_tree))
 
-    # Collect important files if present
-    for name in IMPORTANT_CANDIDATES:
-        cand = root / name
-        if cand.exists() and cand.is_file():
-            important[name] = _safe_read(cand)
-
-    # If there is a src folder, grab a couple of entrypoints (best effort)
-    for extra in ["src/main.ts", "src/index.ts", "src/app.ts", "src/main.py", "src/__main__.py"]:
-        cand = root / extra
-        if cand.exists() and cand.is_file():
-            important[extra] = _safe_read(cand)
+    # Collect important files if present (+ a couple of src entrypoints, best effort).
+    # Reads are I/O-bound, so overlap them instead of paying each latency in turn.
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as ex:
+            contents = ex.map(_safe_read, [root / name for name in candidates])
+            important = dict(zip(candidates, contents))
 
     return RepoSnapshot(repo_path=str(root), tree=tree, important_files=important)
\ No newline at end of file
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-import json
+import atexit
+import codecs
+import functools
+import io
 import re
+import shutil
+import signal
 import subprocess
+import sys
 import threading
 import traceback
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import IO, Any, Callable, TextIO
 
 from tanuki_bot.core.plan import _workspace_paths, _load_tasks_payload, _save_tasks_payload, Task
+from tanuki_bot.projects.models import Project
 from tanuki_bot.projects.registry import Registry
 from tanuki_bot.core.task_execute import apply_task
+from tanuki_bot.utils.fs import json_loads
 
 
 # -------------------------
@@ -29,12 +38,21 @@ _BLUE = "\033[34m"
 _CYAN = "\033[36m"
 
 
+# Static parts of the message formats, joined once at import
+_STEP_MARK = f"{_BLUE}→{_RESET} "
+_WARN_MARK = f"{_CYAN}⚠{_RESET} "
+_DOT = f"{_DIM}.{_RESET}"
+_DIM_END = f"{_RESET}\n"
+
+
 def _print(msg: str) -> None:
-    print(msg, flush=True)
+    # One write (print() issues a second one for the newline) + flush
+    sys.stdout.write(msg + "\n")
+    sys.stdout.flush()
 
 
 def _step(msg: str) -> None:
-    _print(f"{_BLUE}→{_RESET} {msg}")
+    _print(_STEP_MARK + msg)
 
 
 def _task_start(task_id: int, title: str) -> None:
@@ -47,7 +65,7 @@ def _task_ok(task_id: int, extra: str = "") -> None:
 
 
 def _task_warn(task_id: int, msg: str) -> None:
-    _print(f"{_CYAN}⚠{_RESET} {_BOLD}Task {task_id}{_RESET}: {msg}")
+    _print(f"{_WARN_MARK}{_BOLD}Task {task_id}{_RESET}: {msg}")
 
 
 def _task_fail(task_id: int, msg: str) -> None:
@@ -55,7 +73,45 @@ def _task_fail(task_id: int, msg: str) -> None:
 
 
 def _warn(msg: str) -> None:
-    _print(f"{_CYAN}⚠{_RESET} {msg}")
+    _print(_WARN_MARK + msg)
+
+
+class _HeartbeatTicker:
+    """
+    The one daemon thread behind every _Heartbeat: started on first use, then parked
+    on a condition between heartbeats instead of a thread being created per task.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._interval: float | None = None  # None = idle
+        self._thread: threading.Thread | None = None
+
+    def activate(self, interval: float) -> None:
+        with self._cond:
+            self._interval = interval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tanuki-heartbeat", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def deactivate(self) -> None:
+        with self._cond:
+            self._interval = None
+            self._cond.notify()
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                if self._interval is None:
+                    self._cond.wait()
+                # Woken early (activated again / deactivated): re-check and re-arm
+                elif not self._cond.wait(self._interval) and self._interval is not None:
+                    # Printed under the lock, so no dot can follow deactivate()
+                    _print(_DOT)
+
+
+_HEARTBEAT = _HeartbeatTicker()
 
 
 class _Heartbeat:
@@ -66,22 +122,13 @@ class _Heartbeat:
 
     def __init__(self, interval: float = 2.0) -> None:
         self.interval = interval
-        self._stop = threading.Event()
-        self._t: threading.Thread | None = None
 
-    def __enter__(self) -> "_Heartbeat":
-        self._t = threading.Thread(target=self._run, daemon=True)
-        self._t.start()
+    def __enter__(self) -> _Heartbeat:
+        _HEARTBEAT.activate(self.interval)
         return self
 
-    def _run(self) -> None:
-        while not self._stop.wait(self.interval):
-            _print(f"{_DIM}.{_RESET}")
-
     def __exit__(self, exc_type, exc, tb) -> None:
-        self._stop.set()
-        if self._t:
-            self._t.join(timeout=1.0)
+        _HEARTBEAT.deactivate()
 
 
 # -------------------------
@@ -92,76 +139,146 @@ class CmdError(RuntimeError):
     pass
 
 
-def _iter_lines(pipe) -> Iterator[str]:
-    # text mode line iterator
-    for line in iter(pipe.readline, ""):
-        if not line:
-            break
-        yield line
+# Every fd Python opens is non-inheritable (PEP 446), so children don't need
+# close_fds=True; skipping it avoids the close-all-descriptors pass in the child.
+# (It is also a precondition for CPython's posix_spawn path, which further
+# requires cwd=None and an absolute executable path.)
+_CLOSE_FDS = False
+
+
+_RELAY_CHUNK = 64 * 1024
+_UTF8_DECODER = codecs.getincrementaldecoder("utf-8")
 
 
-def _run_live(cmd: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+def _relay_output(pipe: IO[bytes], prefix: str, keep: list[str] | None) -> None:
+    """
+    Stream a child's pipe to stdout with one write+flush per chunk instead of per line.
+    read1() returns whatever the pipe already holds, so chatty commands are written in
+    large batches while a quiet one still shows each line as soon as it arrives.
+    Decoding matches text mode: utf-8 with replacement, universal newlines.
+    """
+    decoder = io.IncrementalNewlineDecoder(_UTF8_DECODER(errors="replace"), translate=True)
+    pending = ""
+    while True:
+        chunk = pipe.read1(_RELAY_CHUNK)
+        *lines, pending = (pending + decoder.decode(chunk, final=not chunk)).split("\n")
+        if not chunk and pending:
+            lines.append(pending)
+        if lines:
+            if keep is not None:
+                keep.append("\n".join(lines) + ("\n" if chunk or not pending else ""))
+            # DIM+prefix ... RESET around every line, built with a single join
+            head = _DIM + prefix
+            sys.stdout.write(head + (_DIM_END + head).join([line.rstrip() for line in lines]) + _DIM_END)
+            sys.stdout.flush()
+        if not chunk:
+            return
+
+
+def _run_live(
+    cmd: list[str], cwd: Path, capture: bool = True, prefix: str = ""
+) -> subprocess.CompletedProcess[str]:
     """
     Run a command streaming stdout/stderr live, but still capture full output.
+    With capture=False nobody reads stdout on its own, so stderr is merged into it:
+    one pipe, one reader thread, and the combined output is kept as `stderr` for errors.
+    `prefix` tags each streamed line (used when several commands stream at once).
     """
     p = subprocess.Popen(
-        cmd,
+        _resolve_exe(cmd),
         cwd=str(cwd),
-        text=True,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        bufsize=1,
+        stderr=subprocess.PIPE if capture else subprocess.STDOUT,
+        close_fds=_CLOSE_FDS,
     )
     assert p.stdout is not None
-    assert p.stderr is not None
 
     out_parts: list[str] = []
     err_parts: list[str] = []
 
-    # Read both streams without blocking forever using threads
-    def _read_stdout() -> None:
-        for line in _iter_lines(p.stdout):
-            out_parts.append(line)
-            _print(f"{_DIM}{line.rstrip()}{_RESET}")
-
-    def _read_stderr() -> None:
-        for line in _iter_lines(p.stderr):
-            err_parts.append(line)
-            _print(f"{_DIM}{line.rstrip()}{_RESET}")
-
-    t1 = threading.Thread(target=_read_stdout, daemon=True)
-    t2 = threading.Thread(target=_read_stderr, daemon=True)
-    t1.start()
-    t2.start()
+    # Read the pipes without blocking forever using threads
+    readers = [
+        threading.Thread(
+            target=_relay_output, args=(p.stdout, prefix, out_parts if capture else err_parts), daemon=True
+        )
+    ]
+    if p.stderr is not None:
+        readers.append(threading.Thread(target=_relay_output, args=(p.stderr, prefix, err_parts), daemon=True))
+    for t in readers:
+        t.start()
 
     rc = p.wait()
-    t1.join(timeout=1.0)
-    t2.join(timeout=1.0)
+    for t in readers:
+        t.join(timeout=1.0)
 
     stdout = "".join(out_parts)
     stderr = "".join(err_parts)
 
     cp = subprocess.CompletedProcess(args=cmd, returncode=rc, stdout=stdout, stderr=stderr)
     if rc != 0:
-        raise CmdError(
-            f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{stdout}\n\nSTDERR:\n{stderr}"
-        )
+        if capture:
+            raise CmdError(
+                f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{stdout}\n\nSTDERR:\n{stderr}"
+            )
+        raise CmdError(f"Command failed: {' '.join(cmd)}\n\nOUTPUT:\n{stderr}")
     return cp
 
 
-def _run(cmd: list[str], cwd: Path, check: bool = True, live: bool = False) -> subprocess.CompletedProcess[str]:
+@functools.cache
+def _which(name: str) -> str | None:
+    return shutil.which(name)
+
+
+def _resolve_exe(cmd: list[str]) -> list[str]:
+    """
+    Absolute path for a bare program name, resolved once per process: otherwise every
+    spawn walks $PATH trying execve on each entry. Unknown names are left to the OS.
+    """
+    if "/" in cmd[0]:
+        return cmd
+    exe = _which(cmd[0])
+    return [exe, *cmd[1:]] if exe else cmd
+
+
+def _spawn_args(cmd: list[str], cwd: Path) -> tuple[list[str], str | None]:
+    """
+    Short git probes: absolute git + `-C repo` instead of cwd=, which (together with
+    close_fds=False) lets CPython launch them via posix_spawn instead of fork+exec.
+    """
+    if cmd[0] == "git":
+        git = _which("git")
+        if git:
+            return [git, "-C", str(cwd), *cmd[1:]], None
+    return _resolve_exe(cmd), str(cwd)
+
+
+def _run(
+    cmd: list[str], cwd: Path, check: bool = True, live: bool = False, capture: bool = True
+) -> subprocess.CompletedProcess[str]:
+    """
+    capture=False is for commands whose stdout nobody reads (fetch/add/push...):
+    stdout is discarded (or, when live, streamed merged with stderr) and only the
+    error output is kept.
+    """
     if live:
         # live runner always checks, but we can simulate check=False by catching
         if not check:
             try:
-                return _run_live(cmd, cwd)
+                return _run_live(cmd, cwd, capture=capture)
             except CmdError as e:
                 # emulate CompletedProcess for check=False
                 msg = str(e)
                 return subprocess.CompletedProcess(args=cmd, returncode=1, stdout="", stderr=msg)
-        return _run_live(cmd, cwd)
+        return _run_live(cmd, cwd, capture=capture)
 
-    p = subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=True)
+    argv, run_cwd = _spawn_args(cmd, cwd)
+    out = subprocess.PIPE if capture else subprocess.DEVNULL
+    p = subprocess.run(
+        argv, cwd=run_cwd, text=True, stdout=out, stderr=subprocess.PIPE, close_fds=_CLOSE_FDS
+    )
+    p.args = cmd
+    if not capture:
+        p.stdout = ""
     if check and p.returncode != 0:
         raise CmdError(
             f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{p.stdout}\n\nSTDERR:\n{p.stderr}"
@@ -171,7 +288,97 @@ def _run(cmd: list[str], cwd: Path, check: bool = True, live: bool = False) -> s
 
 def _run_shell(command: str, cwd: Path, live: bool = True) -> None:
     # default live=True so you SEE what happens
-    _run(["/bin/sh", "-lc", command], cwd=cwd, check=True, live=live)
+    cmd = ["/bin/sh", "-lc", command]
+    if live:
+        # Output is only watched (and reported on failure): one merged stream
+        _run_live(cmd, cwd, capture=False)
+    else:
+        _run(cmd, cwd=cwd, check=True)
+
+
+def _run_shells_parallel(commands: list[str], cwd: Path) -> None:
+    """
+    Run independent shell commands concurrently (wall time = slowest, not the sum).
+    Output is streamed with a "[command]" prefix; all failures are reported together.
+    """
+    with ThreadPoolExecutor(max_workers=len(commands)) as ex:
+        futures = [
+            ex.submit(_run_live, ["/bin/sh", "-lc", c], cwd, False, f"[{c}] ") for c in commands
+        ]
+    errors: list[str] = []
+    for fut in futures:
+        try:
+            fut.result()
+        except CmdError as e:
+            errors.append(str(e))
+    if errors:
+        raise CmdError("\n\n".join(errors))
+
+
+class _GitCoproc:
+    """
+    One long-lived `git cat-file --batch-check` per repo for ref probes.
+    Each query is a line on stdin instead of a fresh git fork+exec.
+    """
+
+    def __init__(self, repo: Path) -> None:
+        self._lock = threading.Lock()
+        self._p: subprocess.Popen[str] | None = subprocess.Popen(
+            _resolve_exe(["git", "--no-pager", "cat-file", "--batch-check=%(objectname) %(objecttype)"]),
+            cwd=str(repo),
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def resolve(self, rev: str) -> str | None:
+        """Object id for `rev`, or None if it does not exist. Raises OSError if the process died."""
+        p = self._p
+        if p is None or p.stdin is None or p.stdout is None:
+            raise OSError("git cat-file co-process is closed")
+        with self._lock:
+            p.stdin.write(rev + "\n")
+            p.stdin.flush()
+            line = p.stdout.readline()
+        if not line:
+            raise OSError("git cat-file co-process exited")
+        oid, _, kind = line.rstrip("\n").partition(" ")
+        return None if kind == "missing" or not kind else oid
+
+    def close(self) -> None:
+        p, self._p = self._p, None
+        if p is None:
+            return
+        if p.stdin:
+            p.stdin.close()
+        try:
+            p.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.wait()
+        if p.stdout:
+            p.stdout.close()
+
+
+_GIT_COPROCS: dict[str, _GitCoproc] = {}
+
+
+def _git_coproc(repo: Path) -> _GitCoproc:
+    key = str(repo)
+    g = _GIT_COPROCS.get(key)
+    if g is None:
+        g = _GIT_COPROCS[key] = _GitCoproc(repo)
+    return g
+
+
+def _close_git_coprocs() -> None:
+    while _GIT_COPROCS:
+        _, g = _GIT_COPROCS.popitem()
+        g.close()
+
+
+atexit.register(_close_git_coprocs)
 
 
 # -------------------------
@@ -179,14 +386,18 @@ def _run_shell(command: str, cwd: Path, live: bool = True) -> None:
 # -------------------------
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# Every byte that is not [a-z0-9] becomes "-" (input is lowercased first)
+_SLUG_TABLE = bytes(c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else ord("-") for c in range(256))
 
 
 def _slug(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
-    return s[:50] or "task"
+    # Single pass over bytes: non-ASCII chars encode to "?" (one per char), the table
+    # maps everything outside [a-z0-9] to "-", and split/join collapses + trims dashes.
+    b = s.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    return b"-".join(filter(None, b.split(b"-"))).decode("ascii")[:50] or "task"
 
 
 @dataclass
@@ -197,33 +408,76 @@ class RunnerConfig:
     pr_base: str = "main"
     pr_draft: bool = True
     checks: list[str] | None = None
+    # Configured checks are ordered (`npm ci` before `npm test`): parallel only on opt-in
+    checks_parallel: bool = False
 
     @staticmethod
-    def load(path: Path) -> "RunnerConfig":
-        if not path.exists():
-            return RunnerConfig(checks=[])
-        data = json.loads(path.read_text(encoding="utf-8"))
+    def load(path: Path) -> RunnerConfig:
+        cfg = RunnerConfig.load_existing(path)
+        return cfg if cfg is not None else RunnerConfig(checks=[])
+
+    @staticmethod
+    def load_existing(path: Path) -> RunnerConfig | None:
+        """Like load(), but None when project.json is missing (one stat, no second exists())."""
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = _CFG_CACHE.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = _CFG_CACHE[path] = (mtime_ns, RunnerConfig._parse(path))
+        # run_once mutates its config (detected base branch...), so hand out a copy
+        cfg = cached[1]
+        return replace(cfg, checks=list(cfg.checks) if cfg.checks is not None else None)
+
+    @staticmethod
+    def invalidate(path: Path) -> None:
+        _CFG_CACHE.pop(path, None)
+
+    @staticmethod
+    def _parse(path: Path) -> RunnerConfig:
+        data = json_loads(path.read_bytes())
+        base_branch = data.get("base_branch", "main")
+        git = data.get("git") or {}
+        pr = data.get("pr") or {}
+        checks = data.get("checks") or {}
         return RunnerConfig(
-            base_branch=data.get("base_branch", "main"),
-            remote=(data.get("git", {}) or {}).get("remote", "origin"),
-            pr_provider=(data.get("pr", {}) or {}).get("provider", "gh"),
-            pr_base=(data.get("pr", {}) or {}).get("base", data.get("base_branch", "main")),
-            pr_draft=bool((data.get("pr", {}) or {}).get("draft", True)),
-            checks=[str(x) for x in ((data.get("checks", {}) or {}).get("commands", []) or [])],
+            base_branch=base_branch,
+            remote=git.get("remote", "origin"),
+            pr_provider=pr.get("provider", "gh"),
+            pr_base=pr.get("base", base_branch),
+            pr_draft=bool(pr.get("draft", True)),
+            checks=[str(x) for x in (checks.get("commands") or [])],
+            checks_parallel=bool(checks.get("parallel", False)),
         )
 
 
+# project.json path -> (mtime_ns, parsed config); reused across run_forever iterations
+_CFG_CACHE: dict[Path, tuple[int, RunnerConfig]] = {}
+
+
 def _is_git_repo(repo: Path) -> bool:
     return (repo / ".git").exists()
 
 
+# Repos whose user.name/user.email were already ensured by this process
+_GIT_IDENTITY_OK: set[str] = set()
+
+
 def _ensure_git_identity(repo: Path) -> None:
-    name = _run(["git", "config", "--get", "user.name"], cwd=repo, check=False).stdout.strip()
-    email = _run(["git", "config", "--get", "user.email"], cwd=repo, check=False).stdout.strip()
+    if str(repo) in _GIT_IDENTITY_OK:
+        return
+    # One `git config` for both keys (missing keys are simply absent from the output)
+    p = _run(["git", "config", "--get-regexp", r"^user\.(name|email)$"], cwd=repo, check=False)
+    found = dict(line.partition(" ")[::2] for line in p.stdout.splitlines())
+    name = found.get("user.name", "").strip()
+    email = found.get("user.email", "").strip()
     if not name:
-        _run(["git", "config", "user.name", "tanuki-bot"], cwd=repo, check=True)
+        _run(["git", "config", "user.name", "tanuki-bot"], cwd=repo, check=True, capture=False)
     if not email:
-        _run(["git", "config", "user.email", "tanuki@local"], cwd=repo, check=True)
+        _run(["git", "config", "user.email", "tanuki@local"], cwd=repo, check=True, capture=False)
+    _GIT_IDENTITY_OK.add(str(repo))
 
 
 def _ensure_git_initialized(repo: Path, base_branch: str = "main") -> None:
@@ -231,26 +485,45 @@ def _ensure_git_initialized(repo: Path, base_branch: str = "main") -> None:
         _ensure_git_identity(repo)
         return
 
-    init_res = _run(["git", "init", "-b", base_branch], cwd=repo, check=False)
+    # Write-only commands: only the exit code / stderr matter, stdout goes to DEVNULL
+    init_res = _run(["git", "init", "-b", base_branch], cwd=repo, check=False, capture=False)
     if init_res.returncode != 0:
-        _run(["git", "init"], cwd=repo, check=True)
-        _run(["git", "checkout", "-b", base_branch], cwd=repo, check=False)
+        _run(["git", "init"], cwd=repo, check=True, capture=False)
+        _run(["git", "checkout", "-b", base_branch], cwd=repo, check=False, capture=False)
 
     _ensure_git_identity(repo)
 
-    head_ok = _run(["git", "rev-parse", "--verify", "HEAD"], cwd=repo, check=False)
+    head_ok = _run(["git", "rev-parse", "--quiet", "--verify", "HEAD"], cwd=repo, check=False, capture=False)
     if head_ok.returncode != 0:
-        _run(["git", "add", "-A"], cwd=repo, check=True)
-        diff = _run(["git", "diff", "--cached", "--name-only"], cwd=repo, check=False).stdout.strip()
-        if diff:
-            _run(["git", "commit", "-m", "chore: initial commit"], cwd=repo, check=True)
+        _run(["git", "add", "-A"], cwd=repo, check=True, capture=False)
+        # exit code 1 == something is staged
+        staged = _run(["git", "diff", "--cached", "--quiet"], cwd=repo, check=False, capture=False).returncode == 1
+        if staged:
+            _run(["git", "commit", "-m", "chore: initial commit"], cwd=repo, check=True, capture=False)
         else:
-            _run(["git", "commit", "--allow-empty", "-m", "chore: initial commit"], cwd=repo, check=True)
+            _run(
+                ["git", "commit", "--allow-empty", "-m", "chore: initial commit"], cwd=repo, check=True, capture=False
+            )
 
 
 def _list_remotes(repo: Path) -> list[str]:
+    # Remotes live in .git/config, which git rewrites (new mtime) on any change:
+    # key the answer on it so run_once/_checkout_base/run_forever share one `git remote`
+    try:
+        st = (repo / ".git" / "config").stat()
+    except OSError:
+        return list(_list_remotes_uncached(repo))
+    return list(_list_remotes_cached(str(repo), st.st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=16)
+def _list_remotes_cached(repo: str, mtime_ns: int) -> tuple[str, ...]:
+    return _list_remotes_uncached(Path(repo))
+
+
+def _list_remotes_uncached(repo: Path) -> tuple[str, ...]:
     p = _run(["git", "remote"], cwd=repo, check=False)
-    return [x.strip() for x in p.stdout.splitlines() if x.strip()]
+    return tuple(x.strip() for x in p.stdout.splitlines() if x.strip())
 
 
 def _has_remote(repo: Path, remote: str) -> bool:
@@ -258,16 +531,34 @@ def _has_remote(repo: Path, remote: str) -> bool:
 
 
 def _git_branch_exists(repo: Path, branch: str) -> bool:
-    p = _run(["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=repo, check=False)
+    try:
+        return _git_coproc(repo).resolve(f"refs/heads/{branch}") is not None
+    except OSError:
+        # co-process unavailable: drop it and fall back to a one-shot probe
+        g = _GIT_COPROCS.pop(str(repo), None)
+        if g is not None:
+            g.close()
+    p = _run(["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=repo, check=False, capture=False)
     return p.returncode == 0
 
 
-def _git_has_head(repo: Path) -> bool:
-    p = _run(["git", "rev-parse", "--verify", "HEAD"], cwd=repo, check=False)
-    return p.returncode == 0
+def _git_local_branches(repo: Path) -> set[str]:
+    p = _run(["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"], cwd=repo, check=False)
+    return {x.strip() for x in p.stdout.splitlines() if x.strip()}
 
 
 def _git_current_branch(repo: Path) -> str | None:
+    # Plain repos: read the HEAD symref directly and ask the cat-file session
+    # whether it points at a commit (unborn branch == no current branch).
+    try:
+        head = (repo / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: refs/heads/"):
+            return None  # detached
+        if _git_coproc(repo).resolve("HEAD") is None:
+            return None
+        return head.removeprefix("ref: refs/heads/")
+    except OSError:
+        pass  # worktree/.git file, or the session is gone: ask git
     p = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo, check=False)
     b = p.stdout.strip()
     if not b or b == "HEAD":
@@ -275,15 +566,26 @@ def _git_current_branch(repo: Path) -> str | None:
     return b
 
 
-def _select_next_task(tasks: list[Task]) -> Task | None:
-    prio_rank = {"P1": 1, "P2": 2, "P3": 3}
-    todo = [t for t in tasks if t.status == "todo"]
-    todo.sort(key=lambda t: (prio_rank.get(t.priority, 9), t.id))
-    return todo[0] if todo else None
+class _RunLog:
+    """
+    run.md of one run, appended line by line (line-buffered, so it can be tailed
+    and survives a crash). The file is only created once something is logged.
+    """
 
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fp: TextIO | None = None
 
-def _update_task(tasks: list[Task], updated: Task) -> list[Task]:
-    return [updated if t.id == updated.id else t for t in tasks]
+    def append(self, line: str) -> None:
+        if self._fp is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fp = self.path.open("a", encoding="utf-8", buffering=1)
+        self._fp.write(line.rstrip() + "\n")
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
 
 
 def _write_run_log(run_dir: Path, name: str, content: str) -> Path:
@@ -294,12 +596,43 @@ def _write_run_log(run_dir: Path, name: str, content: str) -> Path:
 
 
 def _ensure_clean_git(repo: Path) -> None:
-    p = _run(["git", "status", "--porcelain"], cwd=repo, check=True)
-    if p.stdout.strip():
+    # Any output at all means "dirty", so stop reading at the first byte instead of
+    # draining/decoding a possibly huge listing. Untracked files still count: they
+    # would otherwise be swept into the task commit by `git add -A`.
+    # --no-optional-locks: status must not hold index.lock when we cut it short.
+    cmd = ["git", "--no-optional-locks", "status", "--porcelain", "-z"]
+    p = subprocess.Popen(
+        _resolve_exe(cmd), cwd=str(repo), stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=_CLOSE_FDS
+    )
+    assert p.stdout is not None
+    dirty = p.stdout.read(1) != b""
+    if dirty:
+        p.terminate()
+    _, err = p.communicate()
+    if dirty:
         raise RuntimeError("Working tree is not clean. Commit/stash your changes before running tanuki run.")
+    if p.returncode != 0:
+        raise CmdError(
+            f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n\n\nSTDERR:\n{err.decode('utf-8', 'replace')}"
+        )
 
 
 def _detect_default_branch(repo: Path, remote: str) -> str:
+    # refs/remotes/<remote>/HEAD is a loose symref file (never packed): its mtime
+    # only moves on clone/`remote set-head`, so key the answer on it
+    try:
+        st = (repo / ".git" / "refs" / "remotes" / remote / "HEAD").stat()
+    except OSError:
+        return _detect_default_branch_uncached(repo, remote)
+    return _detect_default_branch_cached(str(repo), remote, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _detect_default_branch_cached(repo: str, remote: str, mtime_ns: int) -> str:
+    return _detect_default_branch_uncached(Path(repo), remote)
+
+
+def _detect_default_branch_uncached(repo: Path, remote: str) -> str:
     try:
         p = _run(["git", "symbolic-ref", f"refs/remotes/{remote}/HEAD"], cwd=repo, check=True)
         ref = p.stdout.strip()
@@ -311,53 +644,91 @@ def _detect_default_branch(repo: Path, remote: str) -> str:
     return "main"
 
 
-def _checkout_base(repo: Path, base_branch: str, remote: str | None) -> str:
-    if remote and _has_remote(repo, remote):
+def _start_fetch(repo: Path) -> subprocess.Popen[str]:
+    """Kick off `git fetch --all --prune` in the background; pair with _finish_fetch()."""
+    _step("git fetch --all --prune (background)")
+    return subprocess.Popen(
+        _resolve_exe(["git", "fetch", "--all", "--prune"]),
+        cwd=str(repo),
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=_CLOSE_FDS,
+    )
+
+
+def _finish_fetch(p: subprocess.Popen[str], cancel: bool = False) -> None:
+    # Failures are ignored, like the foreground fetch (check=False)
+    if cancel:
+        p.terminate()
+    _, err = p.communicate()
+    if not cancel:
+        for line in err.splitlines():
+            _print(f"{_DIM}{line.rstrip()}{_RESET}")
+
+
+def _checkout_base(
+    repo: Path,
+    base_branch: str,
+    remote: str | None,
+    fetch: subprocess.Popen[str] | None = None,
+    branches: set[str] | None = None,
+) -> str:
+    if fetch is not None:
+        _finish_fetch(fetch)
+    elif remote and _has_remote(repo, remote):
         _step("git fetch --all --prune")
-        _run(["git", "fetch", "--all", "--prune"], cwd=repo, check=False, live=True)
+        _run(["git", "fetch", "--all", "--prune"], cwd=repo, check=False, live=True, capture=False)
 
+    # One ref listing answers "does base/master exist" and "is there any HEAD commit"
+    # (no local branches == unborn or detached HEAD, where there is no current branch)
+    if branches is None:
+        branches = _git_local_branches(repo)
     effective = base_branch
-    if not _git_branch_exists(repo, effective):
-        if _git_branch_exists(repo, "master"):
+    if effective not in branches:
+        if "master" in branches:
             effective = "master"
         else:
-            cur = _git_current_branch(repo) if _git_has_head(repo) else None
+            cur = _git_current_branch(repo) if branches else None
             if cur:
                 effective = cur
             else:
-                _run(["git", "checkout", "-B", effective], cwd=repo, check=True, live=True)
+                _run(["git", "checkout", "-B", effective], cwd=repo, check=True, live=True, capture=False)
                 return effective
 
-    _run(["git", "checkout", effective], cwd=repo, check=False, live=True)
+    _run(["git", "checkout", effective], cwd=repo, check=False, live=True, capture=False)
     current = _git_current_branch(repo)
     if current != effective:
-        _run(["git", "checkout", "-B", effective], cwd=repo, check=True, live=True)
+        _run(["git", "checkout", "-B", effective], cwd=repo, check=True, live=True, capture=False)
 
     if remote and _has_remote(repo, remote):
         _step(f"git pull --ff-only {remote} {effective}")
-        _run(["git", "pull", "--ff-only", remote, effective], cwd=repo, check=False, live=True)
+        _run(["git", "pull", "--ff-only", remote, effective], cwd=repo, check=False, live=True, capture=False)
 
     return effective
 
 
 def _create_branch(repo: Path, branch: str) -> None:
     if _git_branch_exists(repo, branch):
-        _run(["git", "checkout", branch], cwd=repo, check=True, live=True)
+        _run(["git", "checkout", branch], cwd=repo, check=True, live=True, capture=False)
         return
-    _run(["git", "checkout", "-b", branch], cwd=repo, check=True, live=True)
+    _run(["git", "checkout", "-b", branch], cwd=repo, check=True, live=True, capture=False)
 
 
 def _commit_all(repo: Path, message: str) -> bool:
-    _run(["git", "add", "-A"], cwd=repo, check=True, live=True)
-    diff = _run(["git", "diff", "--cached", "--name-only"], cwd=repo, check=True).stdout.strip()
-    if not diff:
+    _run(["git", "add", "-A"], cwd=repo, check=True, live=True, capture=False)
+    # Try the commit directly; only when it fails do we ask whether the index was
+    # simply empty (exit code, not git's localized "nothing to commit" text).
+    p = _run(["git", "commit", "-m", message], cwd=repo, check=False, live=True, capture=False)
+    if p.returncode == 0:
+        return True
+    if _run(["git", "diff", "--cached", "--quiet"], cwd=repo, check=False, capture=False).returncode == 0:
         return False
-    _run(["git", "commit", "-m", message], cwd=repo, check=True, live=True)
-    return True
+    raise CmdError(p.stderr)
 
 
 def _push_branch(repo: Path, remote: str, branch: str) -> None:
-    _run(["git", "push", "-u", remote, branch], cwd=repo, check=True, live=True)
+    _run(["git", "push", "-u", remote, branch], cwd=repo, check=True, live=True, capture=False)
 
 
 def _create_pr_gh(repo: Path, base: str, title: str, body: str, draft: bool) -> str:
@@ -368,25 +739,93 @@ def _create_pr_gh(repo: Path, base: str, title: str, body: str, draft: bool) ->
     return p.stdout.strip()
 
 
+_CHECK_MARKERS = ("package.json", "pyproject.toml", "pytest.ini")
+
+
 def _autodetect_checks(repo: Path) -> list[str]:
+    # (name, mtime) of the marker files: edits/creations invalidate the cached answer
+    stamps: list[tuple[str, int]] = []
+    for name in _CHECK_MARKERS:
+        try:
+            stamps.append((name, (repo / name).stat().st_mtime_ns))
+        except OSError:
+            pass
+    return list(_autodetect_checks_cached(str(repo), tuple(stamps)))
+
+
+@functools.lru_cache(maxsize=16)
+def _autodetect_checks_cached(repo_path: str, stamps: tuple[tuple[str, int], ...]) -> tuple[str, ...]:
+    repo = Path(repo_path)
+    present = {name for name, _ in stamps}
     checks: list[str] = []
     pkg = repo / "package.json"
-    pyproject = repo / "pyproject.toml"
-    pytest_ini = repo / "pytest.ini"
 
-    if pkg.exists():
+    if "package.json" in present:
         try:
-            data = json.loads(pkg.read_text(encoding="utf-8"))
+            data = json_loads(pkg.read_bytes())
             scripts = (data.get("scripts") or {})
             if isinstance(scripts, dict) and "test" in scripts:
                 checks.append("npm test")
         except Exception:
             pass
 
-    if pyproject.exists() or pytest_ini.exists():
+    if "pyproject.toml" in present or "pytest.ini" in present:
         checks.append("python -m pytest")
 
-    return checks
+    return tuple(checks)
+
+
+# What makes an autodetected check worth running for a change: (file suffixes,
+# directories whose contents always count, at any depth). Anything under tests/
+# (fixtures, data files) triggers pytest; anything under src/ triggers npm test.
+# package.json is covered by ".json".
+_CHECK_TRIGGERS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "npm test": (
+        (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".vue", ".svelte", ".json"),
+        ("src/",),
+    ),
+    "python -m pytest": ((".py", ".pyi", ".toml", ".ini", ".cfg"), ("tests/",)),
+}
+
+
+def _changed_paths(repo: Path) -> list[str]:
+    """Paths touched in the working tree (staged, unstaged or untracked), from one git status."""
+    p = _run(
+        ["git", "--no-optional-locks", "status", "--porcelain", "-z", "--untracked-files=all"],
+        cwd=repo,
+        check=True,
+    )
+    entries = p.stdout.split("\0")
+    paths: list[str] = []
+    i = 0
+    while i < len(entries):
+        e = entries[i]
+        i += 1
+        if len(e) < 4:
+            continue
+        paths.append(e[3:])
+        if "R" in e[:2] or "C" in e[:2]:
+            # rename/copy: the source path follows as its own entry
+            paths.append(entries[i])
+            i += 1
+    return paths
+
+
+def _is_triggered(check: str, paths: list[str]) -> bool:
+    rule = _CHECK_TRIGGERS.get(check)
+    if rule is None:
+        return True  # no rule for it: run rather than risk skipping
+    suffixes, dirs = rule
+    for path in paths:
+        if path.endswith(suffixes):
+            return True
+        if path.startswith(dirs) or any(f"/{d}" in path for d in dirs):
+            return True
+    return False
+
+
+def _relevant_checks(checks: list[str], paths: list[str]) -> list[str]:
+    return [c for c in checks if _is_triggered(c, paths)]
 
 
 def _llm_is_available() -> bool:
@@ -397,51 +836,64 @@ def _llm_is_available() -> bool:
         return False
 
 
+# Blocked reasons that describe environment/tooling problems rather than the task
+_TRANSIENT_MARKERS = (
+    "not a git repository",
+    "no such file or directory: .git",
+    "runner is wired",
+    "apply_task is not implemented",
+    "cannot import tanuki_bot.core.llm.chat",
+    "cannot import tanuki_bot.core.llm",
+    "missing openai api key",
+    "openai authentication failed",
+    "quota",
+    "billing",
+    "insufficient_quota",
+    "429",
+    "did not return a recognizable unified diff",
+    "corrupt patch",
+    "git apply --check failed",
+    "git apply failed",
+    "pathspec",
+    "no changes to commit",
+    "task produced no file changes",
+)
+_TRANSIENT_RE = re.compile("|".join(re.escape(m) for m in _TRANSIENT_MARKERS), re.IGNORECASE)
+
+
 def _should_unblock(reason: str | None) -> bool:
-    if not reason:
-        return False
+    # One scan of the reason for all markers instead of lower() + a substring search each
+    return bool(reason and _TRANSIENT_RE.search(reason))
 
-    r = reason.lower()
-    transient_markers = [
-        "not a git repository",
-        "no such file or directory: .git",
-        "runner is wired",
-        "apply_task is not implemented",
-        "cannot import tanuki_bot.core.llm.chat",
-        "cannot import tanuki_bot.core.llm",
-        "missing openai api key",
-        "openai authentication failed",
-        "quota",
-        "billing",
-        "insufficient_quota",
-        "429",
-        "did not return a recognizable unified diff",
-        "corrupt patch",
-        "git apply --check failed",
-        "git apply failed",
-        "pathspec",
-        "no changes to commit",
-        "task produced no file changes",
-    ]
-    return any(m in r for m in transient_markers)
 
+_PRIO_RANK = {"P1": 1, "P2": 2, "P3": 3}
 
-def _auto_unblock_tasks(tasks: list[Task]) -> tuple[list[Task], int]:
-    can_llm = _llm_is_available()
-    now = _now_iso()
 
-    updated: list[Task] = []
-    changed = 0
+@dataclass
+class _TaskScan:
+    """What run_once needs from the task list, gathered in one pass."""
 
-    for t in tasks:
-        if t.status == "blocked" and _should_unblock(t.blocked_reason):
-            if t.blocked_reason and "llm.chat" in t.blocked_reason.lower():
-                if not can_llm:
-                    updated.append(t)
-                    continue
+    unblocked: int = 0
+    next_pos: int | None = None  # index of the next todo by (priority, id)
+    blocked: list[Task] = field(default_factory=list)
 
-            updated.append(
-                Task(
+
+def _scan_tasks(tasks: list[Task], now: str) -> _TaskScan:
+    """
+    Single pass over the tasks: reset transiently-blocked ones to todo (in place),
+    keep a running min of the todo (priority, id) key and collect what stays blocked.
+    """
+    scan = _TaskScan()
+    best: tuple[int, int] | None = None
+    can_llm: bool | None = None  # only probed if some reason mentions llm.chat
+
+    for i, t in enumerate(tasks):
+        if t.status == "blocked" and _should_unblock(t.blocked_reason):
+            needs_llm = "llm.chat" in (t.blocked_reason or "").lower()
+            if needs_llm and can_llm is None:
+                can_llm = _llm_is_available()
+            if not needs_llm or can_llm:
+                t = tasks[i] = Task(
                     id=t.id,
                     title=t.title,
                     description=t.description,
@@ -454,21 +906,21 @@ def _auto_unblock_tasks(tasks: list[Task]) -> tuple[list[Task], int]:
                     done_at=t.done_at,
                     blocked_reason=None,
                 )
-            )
-            changed += 1
-        else:
-            updated.append(t)
-
-    return updated, changed
+                scan.unblocked += 1
 
+        if t.status == "blocked":
+            scan.blocked.append(t)
+        elif t.status == "todo":
+            key = (_PRIO_RANK.get(t.priority, 9), t.id)
+            if best is None or key < best:
+                best = key
+                scan.next_pos = i
 
-def _has_blocked(tasks: list[Task]) -> bool:
-    return any(t.status == "blocked" for t in tasks)
+    return scan
 
 
-def _blocked_summary(tasks: list[Task]) -> str:
-    blocked = [t for t in tasks if t.status == "blocked"]
-    blocked.sort(key=lambda t: (t.priority, t.id))
+def _blocked_summary(blocked: list[Task]) -> str:
+    blocked = sorted(blocked, key=lambda t: (t.priority, t.id))
     lines: list[str] = []
     for t in blocked[:10]:
         reason = (t.blocked_reason or "").strip().replace("\n", " ")
@@ -522,27 +974,40 @@ def _local_create_index_html(repo: Path) -> None:
 
 
 _LOCAL_TASKS: list[tuple[re.Pattern[str], Callable[[Path, RunnerConfig], None]]] = [
-    (re.compile(r"^\s*initialize repository and create main branch\s*$", re.I), _local_init_repo),
-    (re.compile(r"^\s*initialize repository\s*$", re.I), _local_init_repo),
-    (re.compile(r"create main branch", re.I), _local_init_repo),
-    (re.compile(r"create index\.html with tailwind cdn", re.I), lambda repo, cfg: _local_create_index_html(repo)),
+    (re.compile(r"^\s*initialize repository and create main branch\s*$", re.IGNORECASE), _local_init_repo),
+    (re.compile(r"^\s*initialize repository\s*$", re.IGNORECASE), _local_init_repo),
+    (re.compile(r"create main branch", re.IGNORECASE), _local_init_repo),
+    (re.compile(r"create index\.html with tailwind cdn", re.IGNORECASE), lambda repo, cfg: _local_create_index_html(repo)),
 ]
 
 
+# All matchers folded into one regex. re.match tries the alternatives in list order
+# at the start of the title (unanchored ones scan through a lazy ".*?" prefix),
+# so the first matching entry still wins, exactly like a loop of .search() calls.
+_LOCAL_TASKS_RE = re.compile(
+    "|".join(
+        f"(?P<t{i}>{'' if pat.pattern.startswith('^') else '.*?'}{pat.pattern})"
+        for i, (pat, _) in enumerate(_LOCAL_TASKS)
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 def _try_run_local_task(repo: Path, cfg: RunnerConfig, task: Task) -> bool:
     title = (task.title or "").strip()
-    for pattern, fn in _LOCAL_TASKS:
-        if pattern.search(title):
-            fn(repo, cfg)
-            return True
-    return False
+    m = _LOCAL_TASKS_RE.match(title)
+    if not m or not m.lastgroup:
+        return False
+    _LOCAL_TASKS[int(m.lastgroup[1:])][1](repo, cfg)
+    return True
 
 
 def _finalize_task_success(
     *,
     t: Task,
     tasks: list[Task],
-    tasks_path: Path,
+    pos: int,
+    ctx: _RunContext,
     version: int,
     next_id: int,
     effective_create_pr: bool,
@@ -564,12 +1029,54 @@ def _finalize_task_success(
         done_at=done_at,
         blocked_reason=None,
     )
-    tasks = _update_task(tasks, t_final)
-    _save_tasks_payload(tasks_path, version=version, next_id=next_id, tasks=tasks)
+    tasks[pos] = t_final
+    ctx.save_tasks(version=version, next_id=next_id, tasks=tasks)
     return tasks
 
 
-def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: bool = False) -> dict[str, Any]:
+# run_once results carry one of these as "halt_reason" when there was nothing to run
+HALT_NO_TODO = "no_todo"
+HALT_BLOCKED = "blocked_no_todo"
+
+
+@dataclass
+class _RunContext:
+    """Active project as resolved once; run_forever reuses it across iterations."""
+
+    project_id: str
+    project: Project
+    paths: dict[str, Path]
+    # (file identity, version, next_id, tasks) as last read or written by this process
+    _tasks_cache: tuple[tuple[int, int, int], int, int, list[Task]] | None = None
+
+    def _tasks_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = self.paths["tasks"].stat()
+        except OSError:
+            return None
+        # Writers replace the file atomically, so any outside edit changes the inode
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def load_tasks(self) -> tuple[list[Task], int, int]:
+        """(tasks, version, next_id); reparses tasks.json only if someone else changed it."""
+        stamp = self._tasks_stamp()
+        cached = self._tasks_cache
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return list(cached[3]), cached[1], cached[2]
+
+        payload = _load_tasks_payload(self.paths["tasks"])
+        tasks: list[Task] = payload["tasks"]
+        if stamp is not None:
+            self._tasks_cache = (stamp, payload["version"], payload["next_id"], list(tasks))
+        return tasks, payload["version"], payload["next_id"]
+
+    def save_tasks(self, *, version: int, next_id: int, tasks: list[Task]) -> None:
+        _save_tasks_payload(self.paths["tasks"], version=version, next_id=next_id, tasks=tasks)
+        stamp = self._tasks_stamp()
+        self._tasks_cache = None if stamp is None else (stamp, version, next_id, list(tasks))
+
+
+def _resolve_context() -> _RunContext:
     reg = Registry()
     pid = reg.get_active_id()
     if not pid:
@@ -579,52 +1086,60 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
     if not proj:
         raise RuntimeError("Active project not found in registry")
 
-    p = _workspace_paths(pid)
-    tasks_payload = _load_tasks_payload(p["tasks"])
-    tasks: list[Task] = tasks_payload["tasks"]
-    version: int = tasks_payload["version"]
-    next_id: int = tasks_payload["next_id"]
+    return _RunContext(project_id=pid, project=proj, paths=_workspace_paths(pid))
 
-    repo = Path(proj.repo_path)
 
-    cfg_path = p["base"] / "project.json"
-    cfg = RunnerConfig.load(cfg_path)
+def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: bool = False) -> dict[str, Any]:
+    return _run_once_with(_resolve_context(), create_pr=create_pr, dry_run=dry_run, ignore_blocked=ignore_blocked)
+
 
-    if not cfg_path.exists():
-        cfg.remote = "origin"
-        cfg.base_branch = "main"
-        cfg.pr_base = "main"
-        cfg.pr_provider = "gh"
-        cfg.pr_draft = True
-        cfg.checks = _autodetect_checks(repo)
+def _run_once_with(
+    ctx: _RunContext, *, create_pr: bool = True, dry_run: bool = False, ignore_blocked: bool = False
+) -> dict[str, Any]:
+    proj = ctx.project
+    p = ctx.paths
+    tasks, version, next_id = ctx.load_tasks()
 
-    run_dir = p["base"] / "runs" / _now_iso().replace(":", "").replace("-", "")
-    log_parts: list[str] = []
+    repo = Path(proj.repo_path)
+
+    cfg_path = p["base"] / "project.json"
+    cfg = RunnerConfig.load_existing(cfg_path)
+    auto_checks = cfg is None
+    if cfg is None:
+        # No project.json: field defaults + checks autodetected from the repo, which
+        # are independent of each other and so run concurrently
+        cfg = RunnerConfig(checks=_autodetect_checks(repo), checks_parallel=True)
+
+    # One clock read for everything up to the final transition (run dir, unblock, doing)
+    start_ts = _now_iso()
+    run_dir = p["base"] / "runs" / start_ts.replace(":", "").replace("-", "")
+    log = _RunLog(run_dir / "run.md")
 
     _ensure_git_initialized(repo, base_branch=cfg.base_branch)
 
-    tasks, unblocked = _auto_unblock_tasks(tasks)
-    if unblocked > 0:
-        _save_tasks_payload(p["tasks"], version=version, next_id=next_id, tasks=tasks)
+    scan = _scan_tasks(tasks, start_ts)
+    pos = scan.next_pos
+    t = tasks[pos] if pos is not None else None
+    if scan.unblocked > 0 and (t is None or dry_run):
+        # Otherwise the unblocked tasks are persisted together with the "doing" transition
+        ctx.save_tasks(version=version, next_id=next_id, tasks=tasks)
 
     # If there are blocked tasks, do NOT halt if there is still work to do.
     # Only halt if there are blocked tasks AND no todo tasks remain (unless ignore_blocked=True).
-    if _has_blocked(tasks):
-        summary = _blocked_summary(tasks)
+    if scan.blocked:
+        summary = _blocked_summary(scan.blocked)
         if summary:
             _warn("Hay tareas bloqueadas (las salto si hay TODO):\n" + summary)
 
-        has_todo = any(t.status == "todo" for t in tasks)
-        if (not has_todo) and (not ignore_blocked):
+        if t is None and not ignore_blocked:
             msg = "Hay tareas bloqueadas y no quedan TODO. No avanzo."
-            log_parts.append("status: halted_due_to_blocked")
-            log_parts.append(msg)
-            _write_run_log(run_dir, "run.md", "\n".join(log_parts))
-            return {"ok": False, "message": msg, "log_dir": str(run_dir)}
+            log.append("status: halted_due_to_blocked")
+            log.append(msg)
+            log.close()
+            return {"ok": False, "message": msg, "halt_reason": HALT_BLOCKED, "log_dir": str(run_dir)}
 
-    t = _select_next_task(tasks)
-    if not t:
-        return {"ok": True, "message": "No todo tasks found."}
+    if t is None or pos is None:
+        return {"ok": True, "message": "No todo tasks found.", "halt_reason": HALT_NO_TODO}
 
     _task_start(t.id, t.title)
 
@@ -639,7 +1154,10 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
         _task_ok(t.id, extra="dry-run")
         return {"ok": True, "task_id": t.id, "branch": branch, "pr": "", "log_dir": str(run_dir), "dry_run": True}
 
-    now = _now_iso()
+    # Network-bound: let it run while tasks.json is saved and the local git probes run
+    fetch = _start_fetch(repo) if remote_ok else None
+
+    now = start_ts
     t_doing = Task(
         id=t.id,
         title=t.title,
@@ -653,28 +1171,37 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
         done_at=t.done_at,
         blocked_reason=None,
     )
-    tasks = _update_task(tasks, t_doing)
-    _save_tasks_payload(p["tasks"], version=version, next_id=next_id, tasks=tasks)
+    tasks[pos] = t_doing
+    ctx.save_tasks(version=version, next_id=next_id, tasks=tasks)
 
     try:
-        _step("checking clean git")
-        _ensure_clean_git(repo)
+        # Read-only probes, independent of each other: overlap them with the clean check.
+        # Nothing mutates the repo until _checkout_base below.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            branches_f = ex.submit(_git_local_branches, repo)
+            default_f = ex.submit(_detect_default_branch, repo, cfg.remote) if cfg.remote and remote_ok else None
+
+            _step("checking clean git")
+            _ensure_clean_git(repo)
 
-        if cfg.remote and remote_ok:
-            _step("detecting default branch from remote")
-            cfg.base_branch = _detect_default_branch(repo, cfg.remote)
-            cfg.pr_base = cfg.base_branch
+            if default_f is not None:
+                _step("detecting default branch from remote")
+                cfg.base_branch = default_f.result()
+                cfg.pr_base = cfg.base_branch
+            branches = branches_f.result()
 
         _step(f"checkout base: {cfg.base_branch}")
-        checked_out = _checkout_base(repo, cfg.base_branch, cfg.remote if remote_ok else None)
-        log_parts.append(f"base_branch(checked_out): {checked_out}")
+        checked_out = _checkout_base(
+            repo, cfg.base_branch, cfg.remote if remote_ok else None, fetch=fetch, branches=branches
+        )
+        log.append(f"base_branch(checked_out): {checked_out}")
 
         _step(f"create/checkout branch: {branch}")
         _create_branch(repo, branch)
 
         _step("try local task matcher")
         ran_local = _try_run_local_task(repo, cfg, t_doing)
-        log_parts.append(f"local_task: {ran_local}")
+        log.append(f"local_task: {ran_local}")
 
         if not ran_local:
             _step("apply_task (LLM) running…")
@@ -682,30 +1209,45 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
                 apply_task(repo, t_doing)
             _step("apply_task done")
 
-        for c in (cfg.checks or []):
+        checks = cfg.checks or []
+        if auto_checks and checks:
+            # Guessed checks only run when the change touches files they test;
+            # checks configured in project.json always run.
+            relevant = _relevant_checks(checks, _changed_paths(repo))
+            for c in checks:
+                if c not in relevant:
+                    _step(f"check skipped (no relevant changes): {c}")
+                    log.append(f"check skipped: {c}")
+            checks = relevant
+        parallel = cfg.checks_parallel and len(checks) > 1
+        for c in checks:
             _step(f"check: {c}")
-            log_parts.append(f"check: {c}")
-            _run_shell(c, cwd=repo, live=True)
+            log.append(f"check: {c}")
+            if not parallel:
+                _run_shell(c, cwd=repo, live=True)
+        if parallel:
+            _run_shells_parallel(checks, cwd=repo)
 
         _step("commit changes")
         committed = _commit_all(repo, pr_title)
-        log_parts.append(f"committed: {committed}")
+        log.append(f"committed: {committed}")
 
         pr_url = ""
 
         if not committed:
-            now2 = _now_iso()
+            end_ts = _now_iso()
             tasks = _finalize_task_success(
                 t=t_doing,
                 tasks=tasks,
-                tasks_path=p["tasks"],
+                pos=pos,
+                ctx=ctx,
                 version=version,
                 next_id=next_id,
                 effective_create_pr=effective_create_pr,
-                now_iso=now2,
+                now_iso=end_ts,
             )
-            log_parts.append("note: no changes to commit; skipping push/pr")
-            _write_run_log(run_dir, "run.md", "\n".join(log_parts))
+            log.append("note: no changes to commit; skipping push/pr")
+            log.close()
             _task_warn(t.id, "no changes to commit (marked done/review)")
             return {
                 "ok": True,
@@ -720,7 +1262,7 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
             _step(f"push branch to {cfg.remote}")
             _push_branch(repo, cfg.remote, branch)
         else:
-            log_parts.append("push: skipped (no remote)")
+            log.append("push: skipped (no remote)")
             _step("push skipped (no remote)")
 
         if effective_create_pr:
@@ -730,24 +1272,25 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
             else:
                 raise RuntimeError(f"Unsupported PR provider: {cfg.pr_provider}")
         else:
-            log_parts.append("pr: skipped (no remote or disabled)")
+            log.append("pr: skipped (no remote or disabled)")
             _step("PR skipped (no remote or disabled)")
 
-        now2 = _now_iso()
+        end_ts = _now_iso()
         tasks = _finalize_task_success(
             t=t_doing,
             tasks=tasks,
-            tasks_path=p["tasks"],
+            pos=pos,
+            ctx=ctx,
             version=version,
             next_id=next_id,
             effective_create_pr=effective_create_pr,
-            now_iso=now2,
+            now_iso=end_ts,
         )
 
         if pr_url:
-            log_parts.append(f"pr: {pr_url}")
+            log.append(f"pr: {pr_url}")
 
-        _write_run_log(run_dir, "run.md", "\n".join(log_parts))
+        log.close()
         _task_ok(t.id, extra=(pr_url or branch))
         return {"ok": True, "task_id": t.id, "branch": branch, "pr": pr_url, "log_dir": str(run_dir)}
 
@@ -755,7 +1298,7 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
         err = str(e) if str(e) else "unknown error"
         tb = traceback.format_exc()
 
-        now3 = _now_iso()
+        end_ts = _now_iso()
         t_blocked = Task(
             id=t.id,
             title=t.title,
@@ -764,22 +1307,27 @@ def run_once(*, create_pr: bool = True, dry_run: bool = False, ignore_blocked: b
             priority=t.priority,
             tags=t.tags,
             created_at=t.created_at,
-            updated_at=now3,
+            updated_at=end_ts,
             started_at=t_doing.started_at,
             done_at=None,
             blocked_reason=err[:5000],
         )
-        tasks = _update_task(tasks, t_blocked)
-        _save_tasks_payload(p["tasks"], version=version, next_id=next_id, tasks=tasks)
+        tasks[pos] = t_blocked
+        ctx.save_tasks(version=version, next_id=next_id, tasks=tasks)
 
-        log_parts.append("status: blocked")
-        log_parts.append(f"error: {err}")
-        _write_run_log(run_dir, "run.md", "\n".join(log_parts))
+        log.append("status: blocked")
+        log.append(f"error: {err}")
+        log.close()
         _write_run_log(run_dir, "error.txt", tb)
 
         _task_fail(t.id, err.splitlines()[0][:220])
         raise
 
+    finally:
+        # Failed before _checkout_base consumed it
+        if fetch is not None and fetch.returncode is None:
+            _finish_fetch(fetch, cancel=True)
+
 
 def run_forever(
     *,
@@ -801,44 +1349,66 @@ def run_forever(
     results: list[dict[str, Any]] = []
     ran = 0
 
-    while True:
-        if max_tasks is not None and ran >= max_tasks:
-            _warn(f"max_tasks reached ({max_tasks}). Stopping.")
-            break
+    # Registry + project lookup happen once; a missing project fails fast here
+    ctx = _resolve_context()
 
-        try:
-            r = run_once(
-                create_pr=create_pr,
-                dry_run=dry_run,
-                ignore_blocked=False,  # IMPORTANT: we want to stop if only blocked remain
-            )
-            results.append(r)
-            ran += 1
+    # SIGTERM stops the loop after the current task and cuts a daemon-mode sleep short
+    # (instead of killing the process mid-task with the task left as "doing").
+    # Ctrl-C keeps its KeyboardInterrupt behaviour, which already interrupts the wait.
+    stop = threading.Event()
+    prev_sigterm = None
+    if threading.current_thread() is threading.main_thread():
+        prev_sigterm = signal.signal(signal.SIGTERM, lambda *_: stop.set())
 
-            # Finished
-            if r.get("message") == "No todo tasks found.":
-                _print(f"{_GREEN}✔{_RESET} All TODO tasks completed.")
-                if poll_seconds is None:
-                    break
-                # daemon mode: sleep and continue checking for new tasks
-                _step(f"no TODO tasks; sleeping {poll_seconds}s")
-                threading.Event().wait(poll_seconds)
-                continue
-
-            # Halt due to blocked
-            if r.get("ok") is False and "bloquead" in str(r.get("message", "")).lower():
-                _task_fail(-1, "cannot continue: blocked tasks remain and no TODO available")
+    try:
+        while True:
+            if stop.is_set():
+                _warn("SIGTERM received. Stopping.")
+                break
+            if max_tasks is not None and ran >= max_tasks:
+                _warn(f"max_tasks reached ({max_tasks}). Stopping.")
                 break
 
-            # otherwise: continue loop to next TODO
+            try:
+                r = _run_once_with(
+                    ctx,
+                    create_pr=create_pr,
+                    dry_run=dry_run,
+                    ignore_blocked=False,  # IMPORTANT: we want to stop if only blocked remain
+                )
+                results.append(r)
+                ran += 1
+
+                # Finished
+                halt = r.get("halt_reason")
+                if halt == HALT_NO_TODO:
+                    _print(f"{_GREEN}✔{_RESET} All TODO tasks completed.")
+                    if poll_seconds is None:
+                        break
+                    # daemon mode: sleep and continue checking for new tasks
+                    _step(f"no TODO tasks; sleeping {poll_seconds}s")
+                    stop.wait(poll_seconds)
+                    continue
 
-        except Exception as e:
-            # run_once already marks the task as blocked before re-raising
-            results.append({"ok": False, "error": str(e)})
-            _warn(f"Task execution raised exception (task marked blocked). Continuing. Error: {e}")
+                # Halt due to blocked
+                if halt == HALT_BLOCKED:
+                    _task_fail(-1, "cannot continue: blocked tasks remain and no TODO available")
+                    break
 
-            # Continue to next TODO automatically.
-            # However, if now everything is blocked and no TODO remain, run_once will return halt next iteration.
-            continue
+                # otherwise: continue loop to next TODO
+
+            except Exception as e:
+                # run_once already marks the task as blocked before re-raising
+                results.append({"ok": False, "error": str(e)})
+                _warn(f"Task execution raised exception (task marked blocked). Continuing. Error: {e}")
+
+                # Continue to next TODO automatically.
+                # However, if now everything is blocked and no TODO remain, run_once will return halt next iteration.
+                continue
+    finally:
+        if prev_sigterm is not None:
+            signal.signal(signal.SIGTERM, prev_sigterm)
+        # run_once reuses one cat-file co-process per repo across iterations
+        _close_git_coprocs()
 
     return results
\ No newline at end of file
@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import json
-import re
-from typing import Any
-
 from tanuki_bot.core.llm import text
-from tanuki_bot.core.repo_scan import snapshot_repo
+from tanuki_bot.core.repo_scan import format_tree, snapshot_repo
 from tanuki_bot.projects.registry import Registry
 from tanuki_bot.core.plan import (
     _workspace_paths,
@@ -16,14 +12,16 @@ from tanuki_bot.core.plan import (
     _norm,
     _safe_list,
     _clamp_priority,
+    _parse_tasks_json,
+    _text_after,
+    _TASKS_MARKER,
     Task,
 )
+from tanuki_bot.utils.fs import json_dumps_bytes
 
 
 def _extract_tasks_json(s: str) -> str:
-    pat = r"===TASKS_JSON===\s*(.*)\s*$"
-    m = re.search(pat, s, flags=re.DOTALL)
-    return (m.group(1).strip() if m else "").strip()
+    return _text_after(s, _TASKS_MARKER)
 
 
 def add_tasks_from_brief(brief: str):
@@ -38,7 +36,7 @@ def add_tasks_from_brief(brief: str):
     if not proj:
         raise RuntimeError("Active project not found in registry")
 
-    snap = snapshot_repo(proj.repo_path)
+    snap = snapshot_repo(proj.repo_path, max_tree=400)
 
     existing_ctx = _read_text(p["context"])
     existing_arch = _read_text(p["architecture"])
@@ -62,7 +60,7 @@ def add_tasks_from_brief(brief: str):
     important_block = "\n\n".join(
         f"--- {k} ---\n{v}" for k, v in snap.important_files.items() if v.strip()
     )
-    tree_block = "\n".join(snap.tree[:400])
+    tree_block = format_tree(snap.tree)
 
     prompt = f"""
 Project name: {proj.name}
@@ -77,7 +75,7 @@ Existing ARCHITECTURE.md (for structure):
 {existing_arch}
 
 Existing tasks (avoid duplicates):
-{json.dumps({"tasks": existing_compact}, ensure_ascii=False, indent=2)}
+{json_dumps_bytes({"tasks": existing_compact}).decode("utf-8")}
 
 Repo tree (truncated):
 {tree_block}
@@ -102,14 +100,7 @@ Rules:
     combined = text(prompt, system=system)
     tasks_json = _extract_tasks_json(combined)
 
-    generated: list[dict[str, Any]] = []
-    try:
-        parsed = json.loads(tasks_json)
-        tlist = parsed.get("tasks", [])
-        if isinstance(tlist, list):
-            generated = [x for x in tlist if isinstance(x, dict)]
-    except Exception:
-        generated = []
+    generated = _parse_tasks_json(tasks_json)
 
     if not generated:
         raise RuntimeError("Model did not return valid tasks JSON.")
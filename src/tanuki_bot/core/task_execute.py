@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from tanuki_bot.core.plan import _workspace_paths
+from tanuki_bot.core.plan import _read_text, _workspace_paths
 from tanuki_bot.projects.registry import Registry
 
 
@@ -31,10 +31,8 @@ _DIFF_ONLY_SYSTEM = (
 )
 
 
-def _read_if_exists(path: Path) -> str:
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
+_FENCE_RE = re.compile(r"```(?:diff|patch)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_UNIFIED_HEADER_RE = re.compile(r"^---\s+.+\n\+\+\+\s+.+\n", re.MULTILINE)
 
 
 def _write_debug(workspace_base: Path, name: str, content: str) -> None:
@@ -44,50 +42,48 @@ def _write_debug(workspace_base: Path, name: str, content: str) -> None:
 
 
 def _strip_code_fences(text: str) -> str:
-    m = re.search(r"```(?:diff|patch)?\s*(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    m = _FENCE_RE.search(text)
     if m:
         return m.group(1).strip()
     return text.strip()
 
 
 def _normalize(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # Model output is almost always \n-only: skip both full-copy passes then
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     if not text.endswith("\n"):
         text += "\n"
     return text
 
 
-def _trim_trailing_noise(diff_text: str) -> str:
-    lines = diff_text.splitlines(True)
-    out: list[str] = []
-    started = False
+# Stripped lines that end the diff: a closing code fence or a "---" separator
+_DIFF_STOP_LINES = frozenset({"```", "```diff", "```patch", "---"})
 
-    for line in lines:
-        if not started:
-            if line.startswith("diff --git") or line.startswith("--- "):
-                started = True
-                out.append(line)
-            continue
 
-        if line.strip() in {"```", "```diff", "```patch"}:
-            break
-        if line.strip() == "---":
+def _trim_trailing_noise(diff_text: str) -> str:
+    lines = diff_text.splitlines(True)
+    start = next((i for i, line in enumerate(lines) if line.startswith(("diff --git", "--- "))), None)
+    if start is None:
+        return "\n"
+
+    end = len(lines)
+    for i in range(start + 1, end):
+        if lines[i].strip() in _DIFF_STOP_LINES:
+            end = i
             break
 
-        out.append(line)
-
-    return "".join(out).strip() + "\n"
+    return "".join(lines[start:end]).strip() + "\n"
 
 
 def _extract_unified_diff(text: str) -> str:
     raw = _normalize(_strip_code_fences(text))
 
-    idx = raw.find("diff --git")
-    if idx != -1:
+    if (idx := raw.find("diff --git")) != -1:
         return _trim_trailing_noise(raw[idx:])
 
-    m = re.search(r"^---\s+.+\n\+\+\+\s+.+\n", raw, re.MULTILINE)
-    if m:
+    # No "+++" anywhere means no ---/+++ header pair: skip the regex scan
+    if "+++" in raw and (m := _UNIFIED_HEADER_RE.search(raw)):
         return _trim_trailing_noise(raw[m.start() :])
 
     preview = raw[:500].replace("\n", "\\n")
@@ -97,43 +93,31 @@ def _extract_unified_diff(text: str) -> str:
     )
 
 
-def _git_apply_check(repo: Path, diff_text: str) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        ["git", "apply", "--check", "--whitespace=nowarn", "-"],
-        cwd=str(repo),
-        input=diff_text,
-        text=True,
-        capture_output=True,
-    )
-
-
-def _git_apply(repo: Path, diff_text: str) -> None:
-    check_p = _git_apply_check(repo, diff_text)
-    if check_p.returncode != 0:
-        raise TaskExecuteError(
-            f"git apply --check failed.\n\nSTDOUT:\n{check_p.stdout}\n\nSTDERR:\n{check_p.stderr}"
-        )
-
-    apply_p = subprocess.run(
-        ["git", "apply", "--whitespace=nowarn", "-"],
+def _git_apply(repo: Path, diff_text: str, *extra: str) -> None:
+    # Without --reject, git apply is all-or-nothing: a failing patch leaves the tree
+    # untouched, so a separate --check run would only repeat the same work.
+    p = subprocess.run(
+        ["git", "apply", "--whitespace=nowarn", *extra, "-"],
         cwd=str(repo),
-        input=diff_text,
-        text=True,
-        capture_output=True,
+        input=diff_text.encode("utf-8"),
+        # git apply reports problems on stderr only; stdout is never read
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
-    if apply_p.returncode != 0:
-        raise TaskExecuteError(
-            f"git apply failed.\n\nSTDOUT:\n{apply_p.stdout}\n\nSTDERR:\n{apply_p.stderr}"
-        )
+    if p.returncode != 0:
+        err = p.stderr.decode("utf-8", "replace")
+        raise TaskExecuteError(f"git apply failed.\n\nSTDERR:\n{err}")
 
 
 def _auto_context(repo: Path, workspace_base: Path) -> dict[str, Any]:
-    # ARCHITECTURE.md (si existe)
-    arch = _read_if_exists(workspace_base / "ARCHITECTURE.md")
+    # ARCHITECTURE.md (si existe). Reads are cached on (mtime, size): across the tasks
+    # of one run, files a task did not touch are not re-read. Decoding stays strict:
+    # a non-UTF-8 file fails the task instead of reaching the prompt half-decoded.
+    arch = _read_text(workspace_base / "ARCHITECTURE.md", errors="strict")
 
     # IMPORTANT: meter “estado real” de archivos clave para que el patch aplique
-    index_html = _read_if_exists(repo / "index.html")
-    readme = _read_if_exists(repo / "README.md")
+    index_html = _read_text(repo / "index.html", errors="strict")
+    readme = _read_text(repo / "README.md", errors="strict")
 
     # recorta para no petar el prompt
     def clip(s: str, limit: int) -> str:
@@ -158,7 +142,12 @@ def _auto_context(repo: Path, workspace_base: Path) -> dict[str, Any]:
     }
 
 
-def _build_prompt(*, task_title: str, task_description: str, context: dict[str, Any]) -> str:
+def _static_prefix(context: dict[str, Any]) -> str:
+    """
+    Everything that does not depend on the task, most stable first (rules, hints,
+    architecture, then the files tasks tend to edit): consecutive apply_task calls
+    share this prefix byte for byte, so the provider's prompt cache can reuse it.
+    """
     arch = context.get("architecture_md") or ""
     hints = context.get("repo_hints") or {}
     files = context.get("files") or {}
@@ -173,24 +162,31 @@ def _build_prompt(*, task_title: str, task_description: str, context: dict[str,
         "- Prefer `diff --git a/... b/...` format.\n"
         "- No explanations.\n"
         "- The diff MUST apply to the CURRENT repo state shown below.\n\n"
-        f"Task title:\n{task_title}\n\n"
-        f"Task description:\n{task_description}\n\n"
         "Repo hints:\n"
         f"- has_package_json: {hints.get('has_package_json')}\n"
         f"- has_pyproject_toml: {hints.get('has_pyproject_toml')}\n\n"
-        "CURRENT index.html:\n"
-        "-----\n"
-        f"{index_html}\n"
-        "-----\n\n"
+        "Project architecture (may be truncated):\n"
+        f"{arch}\n\n"
         "CURRENT README.md:\n"
         "-----\n"
         f"{readme}\n"
         "-----\n\n"
-        "Project architecture (may be truncated):\n"
-        f"{arch}\n"
+        "CURRENT index.html:\n"
+        "-----\n"
+        f"{index_html}\n"
+        "-----\n\n"
     )
 
 
+def _task_suffix(task_title: str, task_description: str) -> str:
+    return f"Task title:\n{task_title}\n\nTask description:\n{task_description}\n"
+
+
+def _build_prompt(*, task_title: str, task_description: str, context: dict[str, Any]) -> str:
+    # Static block first, the per-task part last
+    return _static_prefix(context) + _task_suffix(task_title, task_description)
+
+
 def _build_repair_prompt(*, prev_diff: str, error: str) -> str:
     prev = prev_diff if len(prev_diff) <= 12_000 else prev_diff[:12_000] + "\n\n(TRUNCATED)\n"
     err = error if len(error) <= 2_000 else error[:2_000] + "\n(TRUNCATED)\n"
@@ -205,7 +201,7 @@ def _build_repair_prompt(*, prev_diff: str, error: str) -> str:
     )
 
 
-def _call_llm(prompt: str, *, system: str) -> str:
+def _call_llm(prompt: str, *, system: str, cache_key: str | None = None) -> str:
     try:
         from tanuki_bot.core.llm import text as llm_text  # type: ignore
     except Exception as e:
@@ -213,7 +209,7 @@ def _call_llm(prompt: str, *, system: str) -> str:
             "Cannot import tanuki_bot.core.llm.text. Check src/tanuki_bot/core/llm.py."
         ) from e
 
-    resp = llm_text(prompt, system=system)
+    resp = llm_text(prompt, system=system, cache_key=cache_key)
     if not isinstance(resp, str) or not resp.strip():
         raise TaskExecuteError("LLM returned empty response.")
     return resp
@@ -247,8 +243,10 @@ def apply_task(repo: Path, task: Any) -> ApplyResult:
 
     ctx = _auto_context(repo, workspace_base)
     prompt = _build_prompt(task_title=title, task_description=desc, context=ctx)
+    # Same key for every task of the project: routes them to the same prompt cache
+    cache_key = f"tanuki-apply:{pid}"
 
-    raw1 = _call_llm(prompt, system=_DIFF_ONLY_SYSTEM)
+    raw1 = _call_llm(prompt, system=_DIFF_ONLY_SYSTEM, cache_key=cache_key)
     _write_debug(workspace_base, "last_llm_raw_1.txt", raw1)
     diff1 = _extract_unified_diff(raw1)
     _write_debug(workspace_base, "last_diff_1.patch", diff1)
@@ -261,8 +259,16 @@ def apply_task(repo: Path, task: Any) -> ApplyResult:
         if not _is_corrupt_patch_error(str(e)):
             raise
 
+        # Cheap local fix before paying for a repair call: miscounted hunk headers
+        # are the usual "corrupt patch", and --recount makes git ignore the counts.
+        try:
+            _git_apply(repo, diff1, "--recount")
+            return ApplyResult(ok=True, applied=True, notes="Diff applied successfully (attempt 1, recounted).")
+        except TaskExecuteError:
+            pass
+
         repair_prompt = _build_repair_prompt(prev_diff=diff1, error=str(e))
-        raw2 = _call_llm(repair_prompt, system=_DIFF_ONLY_SYSTEM)
+        raw2 = _call_llm(repair_prompt, system=_DIFF_ONLY_SYSTEM, cache_key=cache_key)
         _write_debug(workspace_base, "last_llm_raw_2.txt", raw2)
         diff2 = _extract_unified_diff(raw2)
         _write_debug(workspace_base, "last_diff_2.patch", diff2)
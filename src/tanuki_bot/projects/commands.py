@@ -6,14 +6,14 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from tanuki_bot.projects.registry import Registry
+from tanuki_bot.projects.registry import Registry, _resolved
 
 project_app = typer.Typer(help="Manage projects (register, activate, update, remove).")
 console = Console()
 
 
 def _resolve_repo_path(repo_path: str) -> str:
-    return str(Path(repo_path).expanduser().resolve())
+    return _resolved(repo_path)
 
 
 @project_app.command("up")
@@ -31,11 +31,7 @@ def project_up(
     reg = Registry()
 
     # Reuse if already registered by repo_path
-    existing = None
-    for p in reg.list_projects():
-        if str(Path(p.repo_path).resolve()) == repo:
-            existing = p
-            break
+    existing = reg.exists_repo_path(repo)
 
     if existing:
         reg.set_active(existing.id)
@@ -45,9 +41,10 @@ def project_up(
         )
         return
 
-    proj = reg.add(name=project_name, repo_path=repo)
+    with reg:  # add + touch: one registry write
+        proj = reg.add(name=project_name, repo_path=repo)
+        reg.touch_last_used(proj.id)
     reg.set_active(proj.id)
-    reg.touch_last_used(proj.id)
 
     console.print(
         f"[bold dark_orange]Registered[/] {proj.name} → id=[bold]{proj.id}[/] path=[dim]{proj.repo_path}[/]"
@@ -131,8 +128,9 @@ def set_path(
         raise typer.Exit(code=1)
 
     new_path = _resolve_repo_path(repo_path)
-    reg.update_path(project_id, new_path)
-    reg.touch_last_used(project_id)
+    with reg:
+        reg.update_path(project_id, new_path)
+        reg.touch_last_used(project_id)
 
     console.print(
         f"[bold dark_orange]Updated path[/] {proj.name} → id=[bold]{project_id}[/] path=[dim]{new_path}[/]"
@@ -153,8 +151,9 @@ def rename_project(
         console.print(f"[bold red]Error[/]: Project '{project_id}' not found.")
         raise typer.Exit(code=1)
 
-    reg.rename(project_id, name)
-    reg.touch_last_used(project_id)
+    with reg:
+        reg.rename(project_id, name)
+        reg.touch_last_used(project_id)
     console.print(f"[bold dark_orange]Renamed[/] id=[bold]{project_id}[/] → {name}")
 
 
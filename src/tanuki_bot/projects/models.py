@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass
+import time
 from typing import Any
 
 @dataclass
@@ -13,7 +13,15 @@ class Project:
     last_used_at: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Flat str fields: a plain dict is what asdict() builds, minus its recursive copy
+        return {
+            "id": self.id,
+            "name": self.name,
+            "repo_path": self.repo_path,
+            "created_at": self.created_at,
+            "last_used_at": self.last_used_at,
+        }
 
 def now_iso() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
\ No newline at end of file
+    # Second resolution UTC; gmtime avoids the deprecated utcnow() and a datetime object
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
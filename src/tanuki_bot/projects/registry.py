@@ -1,28 +1,41 @@
 from __future__ import annotations
 
-import json
+import functools
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 from tanuki_bot.config.paths import current_project_path, registry_path
 from tanuki_bot.projects.models import Project, now_iso
+from tanuki_bot.utils.fs import read_json, write_bytes_atomic, write_json
 
 
 def _load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
-        return default
-    return json.loads(path.read_text(encoding="utf-8"))
+    return read_json(path, default)
 
 
 def _save_json(path: Path, data: Any) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(path, data)
+
+
+def _resolved(repo_path: str) -> str:
+    # Relative paths depend on the cwd, so only absolute/~ paths are memoized
+    if repo_path.startswith(("/", "~")):
+        return _resolved_cached(repo_path)
+    return str(Path(repo_path).expanduser().resolve())
+
+
+@functools.lru_cache(maxsize=256)
+def _resolved_cached(repo_path: str) -> str:
+    return str(Path(repo_path).expanduser().resolve())
+
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def _slugify(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    # One pass: the class already folds runs of separators into a single "-"
+    s = _SLUG_RE.sub("-", s.strip().lower()).strip("-")
     return s or "project"
 
 
@@ -30,9 +43,31 @@ class Registry:
     def __init__(self) -> None:
         self.path = registry_path()
         self.data: dict[str, Any] = _load_json(self.path, {"projects": {}})
+        # resolved repo_path -> project id; built on first lookup (resolving is syscalls)
+        self._by_path: dict[str, str] | None = None
+        # Unsaved changes; inside `with Registry() as reg:` mutations are written once on exit
+        self._dirty = False
+        self._batch = 0
+
+    def __enter__(self) -> Self:
+        self._batch += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._batch -= 1
+        if self._batch == 0:
+            self.save()
 
     def save(self) -> None:
-        _save_json(self.path, self.data)
+        """Write registry.json if anything changed since the last write."""
+        if self._dirty:
+            _save_json(self.path, self.data)
+            self._dirty = False
+
+    def _changed(self) -> None:
+        self._dirty = True
+        if not self._batch:
+            self.save()
 
     def list_projects(self) -> list[Project]:
         projects: list[Project] = []
@@ -45,21 +80,26 @@ class Registry:
         p = self.data["projects"].get(project_id)
         return Project(**p) if p else None
 
+    def _path_index(self) -> dict[str, str]:
+        if self._by_path is None:
+            self._by_path = {}
+            # Most recently used first wins, like the old list_projects() scan
+            for p in self.list_projects():
+                self._by_path.setdefault(_resolved(p.repo_path), p.id)
+        return self._by_path
+
     def exists_repo_path(self, repo_path: str) -> Project | None:
         """Return the project that matches repo_path, if any."""
-        wanted = str(Path(repo_path).expanduser().resolve())
-        for p in self.list_projects():
-            if str(Path(p.repo_path).expanduser().resolve()) == wanted:
-                return p
-        return None
+        pid = self._path_index().get(_resolved(repo_path))
+        return self.get(pid) if pid else None
 
     def add(self, name: str, repo_path: str) -> Project:
-        base_id = _slugify(name)
-        project_id = base_id
-        i = 2
-        while project_id in self.data["projects"]:
-            project_id = f"{base_id}-{i}"
-            i += 1
+        projects = self.data["projects"]
+        project_id = base_id = _slugify(name)
+        if project_id in projects:
+            i = 2
+            while (project_id := f"{base_id}-{i}") in projects:
+                i += 1
 
         proj = Project(
             id=project_id,
@@ -69,11 +109,14 @@ class Registry:
             last_used_at=None,
         )
         self.data["projects"][project_id] = proj.to_dict()
-        self.save()
+        if self._by_path is not None:
+            self._by_path.setdefault(_resolved(repo_path), project_id)
+        self._changed()
         return proj
 
     def set_active(self, project_id: str) -> None:
-        current_project_path().write_text(project_id, encoding="utf-8")
+        # Same temp + rename write as registry.json: readers never see an empty pointer
+        write_bytes_atomic(current_project_path(), project_id.encode("utf-8"))
 
     def clear_active(self) -> None:
         p = current_project_path()
@@ -81,10 +124,11 @@ class Registry:
             p.unlink(missing_ok=True)
 
     def get_active_id(self) -> str | None:
-        p = current_project_path()
-        if not p.exists():
+        # One open attempt instead of exists() + read
+        try:
+            value = current_project_path().read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
             return None
-        value = p.read_text(encoding="utf-8").strip()
         return value or None
 
     def touch_last_used(self, project_id: str) -> None:
@@ -93,7 +137,7 @@ class Registry:
             return
         p["last_used_at"] = now_iso()
         self.data["projects"][project_id] = p
-        self.save()
+        self._changed()
 
     # -----------------------------
     # New: update / rename / remove
@@ -105,7 +149,8 @@ class Registry:
             return False
         p["repo_path"] = repo_path
         self.data["projects"][project_id] = p
-        self.save()
+        self._by_path = None
+        self._changed()
         return True
 
     def rename(self, project_id: str, name: str) -> bool:
@@ -114,7 +159,7 @@ class Registry:
             return False
         p["name"] = name
         self.data["projects"][project_id] = p
-        self.save()
+        self._changed()
         return True
 
     def remove(self, project_id: str) -> bool:
@@ -126,7 +171,8 @@ class Registry:
             self.clear_active()
 
         del self.data["projects"][project_id]
-        self.save()
+        self._by_path = None
+        self._changed()
         return True
 
     def remove_by_path(self, repo_path: str) -> bool:
@@ -8,12 +8,18 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from tanuki_bot.projects.registry import Registry
-from tanuki_bot.core.plan import _workspace_paths, _load_tasks_payload, Task
+from tanuki_bot.core.plan import _workspace_paths, _find_task, _load_tasks_payload, Task
 from tanuki_bot.core.task_add import add_tasks_from_brief
 
 task_app = typer.Typer(add_completion=False, no_args_is_help=True)
 console = Console()
 
+_PRIO_RANK = {"P1": 1, "P2": 2, "P3": 3}
+
+
+def _sort_key(t: Task) -> tuple[int, int]:
+    return (_PRIO_RANK.get(t.priority, 9), t.id)
+
 
 def _require_active_paths():
     reg = Registry()
@@ -33,13 +39,17 @@ def list_tasks(
     payload = _load_tasks_payload(p["tasks"])
     tasks: list[Task] = payload["tasks"]
 
-    if status:
-        tasks = [t for t in tasks if t.status == status.strip().lower()]
-    if priority:
-        tasks = [t for t in tasks if t.priority == priority.strip().upper()]
-    if tag:
-        tg = tag.strip().lower()
-        tasks = [t for t in tasks if any(x.lower() == tg for x in t.tags)]
+    # Normalize the filters once, then test all of them in a single pass
+    st = status.strip().lower() if status else None
+    pr = priority.strip().upper() if priority else None
+    tg = tag.strip().lower() if tag else None
+    tasks = [
+        t
+        for t in tasks
+        if (st is None or t.status == st)
+        and (pr is None or t.priority == pr)
+        and (tg is None or any(x.lower() == tg for x in t.tags))
+    ]
 
     table = Table(title="Tasks", show_header=True, header_style="bold bright_white")
     table.add_column("ID", style="dark_orange", no_wrap=True)
@@ -48,10 +58,9 @@ def list_tasks(
     table.add_column("Title", style="white")
     table.add_column("Updated", style="dim", no_wrap=True)
 
-    prio_rank = {"P1": 1, "P2": 2, "P3": 3}
-    tasks_sorted = sorted(tasks, key=lambda t: (prio_rank.get(t.priority, 9), t.id))
+    tasks.sort(key=_sort_key)  # the filtered list is already a fresh copy
 
-    for t in tasks_sorted:
+    for t in tasks:
         table.add_row(str(t.id), t.status, t.priority, t.title, t.updated_at)
 
     console.print(table)
@@ -62,10 +71,7 @@ def show_task(
     task_id: int = typer.Argument(..., help="Task numeric ID"),
 ) -> None:
     p = _require_active_paths()
-    payload = _load_tasks_payload(p["tasks"])
-    tasks: list[Task] = payload["tasks"]
-
-    t = next((x for x in tasks if x.id == task_id), None)
+    t = _find_task(p["tasks"], task_id)
     if not t:
         console.print(f"[bold red]Error[/]: Task {task_id} not found.")
         raise typer.Exit(code=1)
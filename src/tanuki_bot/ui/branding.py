@@ -14,8 +14,10 @@ TANUKI_WORDMARK = r"""
    ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═══╝ ╚═════╝ ╚═╝  ╚═╝╚═╝
 """.strip("\n")
 
+_WORDMARK_TEXT = Text(TANUKI_WORDMARK, style="bold dark_orange")
+
 
 def show_banner(console: Console) -> None:
     console.print()
-    console.print(Text(TANUKI_WORDMARK, style="bold dark_orange"))
+    console.print(_WORDMARK_TEXT)
     console.print()
\ No newline at end of file
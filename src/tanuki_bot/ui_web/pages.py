@@ -1,19 +1,44 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from tanuki_bot.utils.fs import json_dumps_bytes
 
-def dashboard_html(payload: dict[str, Any]) -> str:
-    data = json.dumps(payload)
-
-    html = """<!doctype html>
+_PAGE = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width,initial-scale=1" />
   <title>Tanuki • Dashboard</title>
-  <script src="https://cdn.tailwindcss.com"></script>
+  <style>
+/* The subset of Tailwind (preflight + the classes used below) this page needs,
+   inlined instead of the ~300KB CDN runtime: no extra connection, no JIT pass */
+*,::before,::after{box-sizing:border-box;border:0 solid #e5e7eb}
+body{margin:0;line-height:1.5;font-family:ui-sans-serif,system-ui,sans-serif,"Apple Color Emoji","Segoe UI Emoji"}
+h1,h2,p{margin:0;font-size:inherit;font-weight:inherit}
+code{font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,monospace;font-size:1em}
+.block{display:block}.flex{display:flex}.grid{display:grid}
+.flex-col{flex-direction:column}.items-start{align-items:flex-start}.items-end{align-items:flex-end}
+.justify-between{justify-content:space-between}
+.gap-2{gap:.5rem}.gap-3{gap:.75rem}.gap-4{gap:1rem}
+.grid-cols-1{grid-template-columns:repeat(1,minmax(0,1fr))}
+.max-w-6xl{max-width:72rem}.mx-auto{margin-left:auto;margin-right:auto}
+.mt-1{margin-top:.25rem}.mt-2{margin-top:.5rem}.mt-3{margin-top:.75rem}.mt-8{margin-top:2rem}.mt-10{margin-top:2.5rem}
+.p-3{padding:.75rem}.p-4{padding:1rem}.p-6{padding:1.5rem}
+.px-2{padding-left:.5rem;padding-right:.5rem}.py-1{padding-top:.25rem;padding-bottom:.25rem}
+.rounded-md{border-radius:.375rem}.rounded-lg{border-radius:.5rem}.rounded-xl{border-radius:.75rem}
+.border{border-width:1px}.border-slate-700{border-color:#334155}.border-slate-800{border-color:#1e293b}
+.bg-slate-800{background-color:#1e293b}.bg-slate-900\\/40{background-color:rgb(15 23 42/.4)}.bg-slate-950{background-color:#020617}
+.text-xs{font-size:.75rem;line-height:1rem}.text-sm{font-size:.875rem;line-height:1.25rem}
+.text-base{font-size:1rem;line-height:1.5rem}.text-lg{font-size:1.125rem;line-height:1.75rem}
+.text-3xl{font-size:1.875rem;line-height:2.25rem}
+.font-medium{font-weight:500}.font-semibold{font-weight:600}.tracking-tight{letter-spacing:-.025em}
+.text-slate-100{color:#f1f5f9}.text-slate-200{color:#e2e8f0}.text-slate-300{color:#cbd5e1}
+.text-slate-400{color:#94a3b8}.text-slate-500{color:#64748b}
+.break-all{word-break:break-all}
+@media (min-width:768px){.md\\:grid-cols-2{grid-template-columns:repeat(2,minmax(0,1fr))}}
+@media (min-width:1024px){.lg\\:grid-cols-3{grid-template-columns:repeat(3,minmax(0,1fr))}}
+  </style>
 </head>
 <body class="bg-slate-950 text-slate-100">
   <div class="max-w-6xl mx-auto p-6">
@@ -36,11 +61,19 @@ def dashboard_html(payload: dict[str, Any]) -> str:
     </div>
   </div>
 
+<script type="application/json" id="data">__DATA__</script>
 <script>
-const DATA = __DATA__;
+// A JSON data island: JSON.parse is a cheaper parse than an equivalent JS object literal
+let DATA = JSON.parse(document.getElementById("data").textContent);
+
+// DATA holds raw registry values (also what /api/state returns): escape on insert
+const ESC = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"};
+function esc(value) {
+  return String(value ?? "").replace(/[&<>"']/g, c => ESC[c]);
+}
 
 function badge(text) {
-  return `<span class="px-2 py-1 rounded-md bg-slate-800 text-slate-200 text-xs border border-slate-700">${text}</span>`;
+  return `<span class="px-2 py-1 rounded-md bg-slate-800 text-slate-200 text-xs border border-slate-700">${esc(text)}</span>`;
 }
 
 function projectCard(p, isActive) {
@@ -48,8 +81,8 @@ function projectCard(p, isActive) {
   <div class="rounded-xl border border-slate-800 bg-slate-900/40 p-4">
     <div class="flex items-start justify-between gap-3">
       <div>
-        <div class="text-base font-semibold">${p.name}</div>
-        <div class="text-xs text-slate-400 mt-1 break-all">${p.repo_path}</div>
+        <div class="text-base font-semibold">${esc(p.name)}</div>
+        <div class="text-xs text-slate-400 mt-1 break-all">${esc(p.repo_path)}</div>
       </div>
       <div class="flex flex-col items-end gap-2">
         ${isActive ? badge("ACTIVE") : ""}
@@ -57,8 +90,8 @@ function projectCard(p, isActive) {
       </div>
     </div>
     <div class="mt-3 text-xs text-slate-500">
-      created: ${p.created_at}<br/>
-      last used: ${p.last_used_at || "-"}
+      created: ${esc(p.created_at)}<br/>
+      last used: ${esc(p.last_used_at || "-")}
     </div>
   </div>`;
 }
@@ -87,16 +120,39 @@ function render() {
     const ap = DATA.projects.find(x => x.id === DATA.active_id);
     activeBox.innerHTML = ap
       ? `<div class="rounded-xl border border-slate-800 bg-slate-900/40 p-4">
-           <div class="text-base font-semibold">${ap.name}</div>
-           <div class="text-xs text-slate-400 mt-1 break-all">${ap.repo_path}</div>
+           <div class="text-base font-semibold">${esc(ap.name)}</div>
+           <div class="text-xs text-slate-400 mt-1 break-all">${esc(ap.repo_path)}</div>
          </div>`
       : `<div class="text-slate-400">Active project not found in registry.</div>`;
   }
 }
 
 render();
+
+// Poll the data only (/api/state); the browser revalidates it with its ETag
+setInterval(async () => {
+  try {
+    const res = await fetch("/api/state");
+    if (res.ok) {
+      DATA = await res.json();
+      render();
+    }
+  } catch (e) {
+    // server stopped; keep showing the last state
+  }
+}, 5000);
 </script>
 </body>
 </html>
 """
-    return html.replace("__DATA__", data)
\ No newline at end of file
+
+# Encoded and split around the data marker once, at import
+_PAGE_HEAD, _PAGE_TAIL = _PAGE.encode("utf-8").split(b"__DATA__")
+
+
+def dashboard_html(payload: dict[str, Any]) -> bytes:
+    """The dashboard page, UTF-8 encoded and ready to send."""
+    # Values are raw: "<" only occurs inside JSON strings, and "<" is the same
+    # string but can't open or close a tag inside the data island
+    data = json_dumps_bytes(payload, indent=False).replace(b"<", b"\\u003c")
+    return b"".join((_PAGE_HEAD, data, _PAGE_TAIL))
\ No newline at end of file
@@ -1,31 +1,154 @@
 from __future__ import annotations
 
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import functools
+import gzip
+import hashlib
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from typing import Any
 
+from tanuki_bot.config.paths import current_project_path, registry_path
 from tanuki_bot.projects.registry import Registry
 from tanuki_bot.ui_web.pages import dashboard_html
+from tanuki_bot.utils.fs import json_dumps_bytes
+
+try:
+    import brotli  # optional; gzip is always available
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
 
 
 def build_payload() -> dict[str, Any]:
+    """
+    Raw registry values, as /api/state serves them. HTML escaping belongs to the
+    page (pages.py): the data island and the client-side render.
+    """
     reg = Registry()
     projects = [p.to_dict() for p in reg.list_projects()]
     return {"projects": projects, "active_id": reg.get_active_id()}
 
 
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    # Both files are replaced atomically, so a write always changes the inode
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _accepted_codings(header: str) -> set[str]:
+    """Codings listed in Accept-Encoding, minus those refused with q=0."""
+    out = set()
+    for part in header.lower().split(","):
+        name, _, params = part.partition(";")
+        q = params.strip().removeprefix("q=").strip()
+        if q and not q.strip("0."):  # q=0, q=0.0, ...
+            continue
+        out.add(name.strip())
+    return out
+
+
+@dataclass(frozen=True)
+class _Rendered:
+    etag: str  # of the identity body; encoded variants get a suffix
+    bodies: dict[str, bytes]  # content-coding -> body ("identity", "gzip", "br")
+
+    def pick(self, accept_encoding: str) -> tuple[str, bytes, str]:
+        """(coding, body, ETag) for the best encoding the client accepts."""
+        accepted = _accepted_codings(accept_encoding)
+        for coding in ("br", "gzip"):
+            if coding in accepted and coding in self.bodies:
+                return coding, self.bodies[coding], f'{self.etag[:-1]}-{coding}"'
+        return "identity", self.bodies["identity"], self.etag
+
+
+# Serializes cache misses: concurrent GETs after a change build the Registry and
+# the page once, not once per thread
+_RENDER_LOCK = threading.Lock()
+
+
+# path -> (resource, Content-Type). "state" is the page's data alone, for polling.
+_ROUTES = {
+    "/": ("page", "text/html; charset=utf-8"),
+    "/index.html": ("page", "text/html; charset=utf-8"),
+    "/api/state": ("state", "application/json"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _payload(version: tuple[object, ...]) -> dict[str, Any]:
+    # Shared by both resources: one Registry load per registry version
+    return build_payload()
+
+
+@functools.lru_cache(maxsize=2)
+def _rendered(version: tuple[object, ...], resource: str) -> _Rendered:
+    """A resource for one registry version; rebuilt only when the files change."""
+    payload = _payload(version)
+    if resource == "state":
+        return _encoded(json_dumps_bytes(payload, indent=False))
+    return _encoded(dashboard_html(payload))
+
+
+@functools.lru_cache(maxsize=8)
+def _encoded(body: bytes) -> _Rendered:
+    # Keyed on content: a rewrite that leaves the body unchanged (e.g. the same
+    # project set active again) skips the compression and hashing
+    bodies = {"identity": body, "gzip": gzip.compress(body, 9, mtime=0)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+    return _Rendered(etag=f'"{hashlib.sha1(body).hexdigest()}"', bodies=bodies)
+
+
+_KEEP_ALIVE_SECONDS = 30
+
+
 class Handler(BaseHTTPRequestHandler):
+    # Keep-alive: every response below carries a length (or has no body)
+    protocol_version = "HTTP/1.1"
+    # Buffered wfile: status line, headers and body leave in one send() when the
+    # handler returns, instead of one for the headers and another for the body
+    wbufsize = 64 * 1024
+    # Idle keep-alive connections are closed (and their thread freed) after this
+    timeout = _KEEP_ALIVE_SECONDS
+
+    def _validator_headers(self, etag: str) -> None:
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        # A polling browser reuses its copy briefly, then revalidates (-> 304)
+        self.send_header("Cache-Control", "private, max-age=2")
+        self.send_header("Keep-Alive", f"timeout={_KEEP_ALIVE_SECONDS}")
+
     def do_GET(self) -> None:
-        if self.path not in ("/", "/index.html"):
+        route = _ROUTES.get(self.path)
+        if route is None:
             self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        version = (_stamp(registry_path()), _stamp(current_project_path()))
+        resource, content_type = route
+        with _RENDER_LOCK:
+            rendered = _rendered(version, resource)
+        coding, body, etag = rendered.pick(self.headers.get("Accept-Encoding", ""))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self._validator_headers(etag)
             self.end_headers()
             return
 
-        html = dashboard_html(build_payload()).encode("utf-8")
         self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(html)))
+        self.send_header("Content-Type", content_type)
+        if coding != "identity":
+            self.send_header("Content-Encoding", coding)
+        self.send_header("Content-Length", str(len(body)))
+        self._validator_headers(etag)
         self.end_headers()
-        self.wfile.write(html)
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args: object) -> None:
         # Silence default HTTP logs (clean terminal)
@@ -33,6 +156,7 @@ class Handler(BaseHTTPRequestHandler):
 
 
 def serve(port: int = 3847) -> None:
-    httpd = HTTPServer(("127.0.0.1", port), Handler)
+    # One thread per connection (daemon threads): a slow client can't stall the others
+    httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
     print(f"Tanuki UI running at http://127.0.0.1:{port} (Ctrl+C to stop)")
     httpd.serve_forever()
\ No newline at end of file
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # optional speedup; stdlib json is the fallback
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def json_dumps_bytes(data: Any, *, indent: bool = True) -> bytes:
+    """UTF-8 JSON, pretty (indent=2) or compact, via orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Parse JSON; raises ValueError on invalid input with either backend."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(path: Path, default: Any) -> Any:
+    if not path.exists():
+        return default
+    return json_loads(path.read_bytes())
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write via a sibling temp file + os.replace, so readers (or a crash mid-write)
+    never see a truncated file. No fsync: this is crash-consistency, not durability.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        # Raw fd + os.write: the payload is already one bytes buffer, no file object needed
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: Path, data: Any) -> None:
+    write_bytes_atomic(path, json_dumps_bytes(data))